@@ -21,16 +21,22 @@ from xopr.stac.config import load_config, save_config, validate_config
 from xopr.stac.metadata import discover_campaigns, discover_flight_lines, collect_uniform_metadata
 from xopr.stac.catalog import create_items_from_flight_data, create_collection, export_collection_to_parquet
 from xopr.stac.geometry import build_collection_extent_and_geometry
+from xopr.stac.build import campaign_cache_key, load_cached_campaign, save_cached_campaign
 
+logger = logging.getLogger(__name__)
 
-def build_collection_parallel(campaign_path: Path, conf: DictConfig, client: Client) -> Optional[Path]:
+
+def collect_flight_items(flight_lines: List[dict], campaign_name: str,
+                         conf: DictConfig, client: Client) -> List[pystac.Item]:
     """
-    Build a parquet collection for a single campaign using parallel processing.
+    Create STAC items for all flight lines of a campaign in parallel.
 
     Parameters
     ----------
-    campaign_path : Path
-        Path to campaign directory
+    flight_lines : List[dict]
+        Flight metadata from discover_flight_lines()
+    campaign_name : str
+        Campaign name used for asset URLs
     conf : DictConfig
         Configuration object
     client : Client
@@ -38,28 +44,20 @@ def build_collection_parallel(campaign_path: Path, conf: DictConfig, client: Cli
 
     Returns
     -------
-    Path or None
-        Path to created parquet file, or None if failed
+    List[pystac.Item]
+        Items from all flights that were processed successfully
     """
-    campaign_name = campaign_path.name
-    print(f"🔍 Discovering flight lines for campaign: {campaign_name}")
-    
-    # Discover flight lines
-    flight_lines = discover_flight_lines(campaign_path, conf)
-    if not flight_lines:
-        print(f"  ❌ No flight lines found for campaign {campaign_name}")
-        return None
-    
-    print(f"   Found {len(flight_lines)} flight lines")
-    
-    # Apply max_items limit
-    if conf.processing.max_items:
-        flight_lines = flight_lines[:conf.processing.max_items]
-        print(f"   Limited to {len(flight_lines)} flights (max_items={conf.processing.max_items})")
-    
+    # Submit the largest flights first (longest-processing-time-first) so a
+    # big flight doesn't start last and leave the other workers idle
+    flight_lines = sorted(
+        flight_lines,
+        key=lambda fd: len(fd['data_files'].get(conf.data.primary_product, {})),
+        reverse=True
+    )
+
     # Submit flight processing tasks
     print(f"📡 Processing {len(flight_lines)} flights in parallel...")
-    futures = []
+    future_to_flight = {}
     for flight_data in flight_lines:
         future = client.submit(create_items_from_flight_data,
             flight_data,
@@ -69,24 +67,76 @@ def build_collection_parallel(campaign_path: Path, conf: DictConfig, client: Cli
             conf.data.primary_product,
             False  # verbose=False for parallel
         )
-        futures.append(future)
+        future_to_flight[future] = flight_data['flight_id']
     
     # Collect results
     all_items = []
     completed_count = 0
     
-    for future in as_completed(futures):
+    for future in as_completed(future_to_flight):
+        flight_id = future_to_flight[future]
         try:
             items = future.result()
             all_items.extend(items)
             completed_count += 1
-            print(f"   Completed flight {completed_count}/{len(flight_lines)} "
-                  f"({len(items)} items)")
+            logger.debug("Completed flight %s (%d/%d, %d items)",
+                         flight_id, completed_count, len(flight_lines), len(items))
         except Exception as e:
-            logging.warning(f"   ⚠️ Failed to process flight: {e}")
+            logger.warning("Failed to process flight %s: %s", flight_id, e)
             completed_count += 1
     
     print(f"✅ Processed {len(all_items)} total items from {completed_count} flights")
+
+    return all_items
+
+
+def build_collection_parallel(campaign_path: Path, conf: DictConfig, client: Client) -> Optional[Path]:
+    """
+    Build a parquet collection for a single campaign using parallel processing.
+
+    Parameters
+    ----------
+    campaign_path : Path
+        Path to campaign directory
+    conf : DictConfig
+        Configuration object
+    client : Client
+        Dask distributed client for parallel processing
+
+    Returns
+    -------
+    Path or None
+        Path to created parquet file, or None if failed
+    """
+    campaign_name = campaign_path.name
+
+    # Reuse items from a previous run if the campaign is unchanged on disk,
+    # before spending time on flight discovery
+    cache_dir = conf.processing.get('cache_dir')
+    cache_key = campaign_cache_key(campaign_path, conf) if cache_dir else None
+    all_items = load_cached_campaign(cache_key, cache_dir, 'items', list) if cache_key else None
+
+    if all_items is not None:
+        print(f"♻️  Using {len(all_items)} cached items for {campaign_name}")
+    else:
+        print(f"🔍 Discovering flight lines for campaign: {campaign_name}")
+
+        # Discover flight lines
+        flight_lines = discover_flight_lines(campaign_path, conf)
+        if not flight_lines:
+            print(f"  ❌ No flight lines found for campaign {campaign_name}")
+            return None
+
+        print(f"   Found {len(flight_lines)} flight lines")
+
+        # Apply max_items limit
+        if conf.processing.max_items:
+            flight_lines = flight_lines[:conf.processing.max_items]
+            print(f"   Limited to {len(flight_lines)} flights (max_items={conf.processing.max_items})")
+
+        all_items = collect_flight_items(flight_lines, campaign_name, conf, client)
+        if cache_key and all_items:
+            save_cached_campaign(all_items, cache_key, cache_dir, 'items')
     
     if not all_items:
         print(f"❌ No items created for campaign {campaign_name}")
@@ -116,11 +166,8 @@ def build_collection_parallel(campaign_path: Path, conf: DictConfig, client: Cli
         geometry=geometry
     )
     
-    for key, value in extra_fields.items():
-        collection.extra_fields[key] = value
-    
-    for item in all_items:
-        collection.add_item(item)
+    collection.extra_fields.update(extra_fields)
+    collection.add_items(all_items)
     
     # Export to parquet
     output_dir = Path(conf.output.path)
@@ -128,7 +175,7 @@ def build_collection_parallel(campaign_path: Path, conf: DictConfig, client: Cli
     
     print(f"💾 Writing parquet file...")
     parquet_path = export_collection_to_parquet(
-        collection, conf
+        collection, conf, items=all_items
     )
     
     print(f"✅ Successfully created: {parquet_path.name}")
@@ -166,6 +213,10 @@ def process_campaign_with_fresh_cluster(campaign_path: Path, conf: DictConfig) -
         # Removed death_timeout as it's not needed with default thread workers
     )
 
+    # Let small campaigns release workers they can't keep busy
+    if conf.processing.get('adaptive', False):
+        cluster.adapt(minimum=1, maximum=conf.processing.n_workers)
+
     client = None
     try:
         client = Client(cluster)
@@ -232,8 +283,7 @@ def process_catalog(conf: DictConfig):
                 print(f"⚠️ No data produced for {campaign['name']}")
 
         except Exception as e:
-            logging.error(f"❌ Failed to process {campaign['name']}: {e}")
-            print(f"❌ Failed to process {campaign['name']}: {e}")
+            logger.error("❌ Failed to process %s: %s", campaign['name'], e)
 
     print("=" * 60)
 
@@ -262,6 +312,16 @@ def main():
         conf = load_config(args.config, args.overrides, args.env)
         validate_config(conf)
         
+        logging.basicConfig(
+            level=logging.INFO if conf.logging.verbose else conf.logging.get('level', 'INFO'),
+            format="%(levelname)s %(name)s: %(message)s"
+        )
+        if conf.logging.verbose:
+            # Debug output only from xopr and this script, not from
+            # dependencies such as distributed, fsspec or urllib3
+            for name in ("xopr", __name__):
+                logging.getLogger(name).setLevel(logging.DEBUG)
+        
         if conf.logging.verbose:
             print(OmegaConf.to_yaml(conf))
         
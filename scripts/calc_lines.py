@@ -1,50 +1,142 @@
 #!/usr/bin/env python3
 """Calculate total kilometers of flight lines from OPR STAC catalog."""
 
+import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 try:
-    import geopandas as gpd
+    import numpy as np
+    import pyarrow as pa
+    import shapely
     from pyproj import Geod
     from rustac import DuckdbClient
-    from shapely.geometry import box
 except ImportError as e:
     # Exit with non-zero code so GitHub Actions knows it failed
     print(f"Error: Missing required module - {e}", file=sys.stderr)
     print('{"error": "Missing dependencies"}')
     sys.exit(1)
 
+
+# DuckDB settings for scanning many small parquet files on a high-latency
+# object store: keep HTTP connections open, retry transient failures, cache
+# parquet footers and prefetch row groups across files
+DUCKDB_SCAN_SETTINGS = {
+    "threads": os.cpu_count() or 1,
+    "external_threads": os.cpu_count() or 1,
+    "http_keep_alive": "true",
+    "http_retries": 3,
+    "enable_object_cache": "true",
+    "prefetch_all_parquet_files": "true",
+}
+
+
+def configure_duckdb(client, settings=DUCKDB_SCAN_SETTINGS):
+    """Apply DuckDB settings, skipping any this DuckDB version doesn't know."""
+    for name, value in settings.items():
+        try:
+            client.execute(f"SET {name} = {value}")
+        except Exception as e:
+            print(f"Warning: Could not set DuckDB option {name}: {e}", file=sys.stderr)
+
+
+def hemisphere_query(catalog_root, hemisphere):
+    """
+    SQL selecting the WKB geometries of one hemisphere of the catalog.
+
+    The catalog is Hive-partitioned by hemisphere, so globbing the partition
+    directory lets DuckDB skip the other hemisphere's files entirely instead
+    of testing every item against a half-planet bounding box.
+    """
+    return (
+        "SELECT ST_AsWKB(geometry) AS geometry FROM read_parquet("
+        f"'{catalog_root}/hemisphere={hemisphere}/**/*.parquet', hive_partitioning = true)"
+    )
+
+
+def geometries_from_arrow(table):
+    """
+    Decode the WKB ``geometry`` column of an Arrow table into shapely geometries.
+
+    Avoids building a GeoDataFrame when only the geometries are needed.
+    """
+    column = pa.table(table).column("geometry")
+    if isinstance(column.type, pa.ExtensionType):
+        column = pa.chunked_array(
+            [chunk.storage for chunk in column.chunks], column.type.storage_type
+        )
+    return shapely.from_wkb(column.to_numpy())
+
+
+def total_geodesic_length(geometries, geod, max_workers=None, min_chunk_size=100_000):
+    """
+    Sum the geodesic length in meters of an array of (multi)line geometries.
+
+    All segments are measured with vectorized ``Geod.inv`` calls instead of
+    one ``Geod.geometry_length`` call per geometry. Large inputs are split
+    into chunks solved on a thread pool; PROJ's geodesic solver runs
+    without the GIL, so chunks use all available cores.
+    """
+    # Split multi-part geometries so segments never join separate parts;
+    # polygons count their exterior ring, as in Geod.geometry_length
+    parts = shapely.get_parts(geometries)
+    polygons = shapely.get_type_id(parts) == 3
+    if polygons.any():
+        parts[polygons] = shapely.get_exterior_ring(parts[polygons])
+
+    coords, part_index = shapely.get_coordinates(parts, return_index=True)
+    if len(coords) < 2:
+        return 0.0
+
+    # Segment endpoints; drop the pseudo-segments that span two parts
+    same_part = part_index[:-1] == part_index[1:]
+    lons, lats = coords[:, 0], coords[:, 1]
+    segments = (lons[:-1][same_part], lats[:-1][same_part],
+                lons[1:][same_part], lats[1:][same_part])
+
+    def chunk_length(chunk):
+        _, _, distances = geod.inv(*(a[chunk] for a in segments))
+        return np.sum(distances)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    n_chunks = max(1, min(max_workers, len(segments[0]) // min_chunk_size))
+    bounds = np.linspace(0, len(segments[0]), n_chunks + 1, dtype=int)
+    chunks = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+    if n_chunks == 1:
+        return float(chunk_length(chunks[0]))
+    with ThreadPoolExecutor(max_workers=n_chunks) as executor:
+        return float(sum(executor.map(chunk_length, chunks)))
+
+
 try:
     # Initialize geodesic calculator
     geod = Geod(ellps="WGS84")
     
-    # Connect to parquet files
+    # Connect to parquet files and tune the scan for GCS
     client = DuckdbClient()
-    partitioned_destination = 'gs://opr_stac/catalog/**/*parquet'
+    configure_duckdb(client)
+    catalog_root = 'gs://opr_stac/catalog'
     
-    # Define regions
-    arctic_region = box(-180, 0, 180, 90)      # Northern hemisphere
-    antarctic_region = box(-180, -90, 180, 0)   # Southern hemisphere
+    # Query the hemispheres one after the other: the DuckDB connection is
+    # not safe to share between threads, and DuckDB already parallelizes
+    # each scan internally
+    # Only the geometry column is used, so only fetch that column's chunks
+    table_arctic = client.query_to_table(hemisphere_query(catalog_root, "north"))
+    table_antarctic = client.query_to_table(hemisphere_query(catalog_root, "south"))
     
     # Calculate Arctic (Northern hemisphere)
-    table_arctic = client.search_to_arrow(partitioned_destination, 
-                                          intersects=arctic_region.__geo_interface__)
     if table_arctic is None or len(table_arctic) == 0:
         raise ValueError("No Arctic data found")
         
-    ds_arctic = gpd.GeoDataFrame.from_arrow(table_arctic)
-    arctic_meters = ds_arctic['geometry'].apply(geod.geometry_length).sum()
+    arctic_meters = total_geodesic_length(geometries_from_arrow(table_arctic), geod)
     arctic_km = round(arctic_meters / 1000)
     
     # Calculate Antarctic (Southern hemisphere)  
-    table_antarctic = client.search_to_arrow(partitioned_destination,
-                                             intersects=antarctic_region.__geo_interface__)
     if table_antarctic is None or len(table_antarctic) == 0:
         raise ValueError("No Antarctic data found")
         
-    ds_antarctic = gpd.GeoDataFrame.from_arrow(table_antarctic)
-    antarctic_meters = ds_antarctic['geometry'].apply(geod.geometry_length).sum()
+    antarctic_meters = total_geodesic_length(geometries_from_arrow(table_antarctic), geod)
     antarctic_km = round(antarctic_meters / 1000)
     
     # Total
@@ -14,30 +14,39 @@ Collection is extracted from the filename or metadata.
 import os
 import sys
 import argparse
-import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Tuple
 import re
 
 try:
+    import pyarrow.compute as pc
     import pyarrow.parquet as pq
-    import pandas as pd
 except ImportError:
-    print("Error: pyarrow and pandas are required. Install with: pip install pyarrow pandas")
+    print("Error: pyarrow is required. Install with: pip install pyarrow")
     sys.exit(1)
 
+try:
+    from google.cloud import storage
+except ImportError:
+    # Only needed for actual uploads; dry runs work without it
+    storage = None
 
-def run_command(cmd: List[str], env=None) -> Tuple[bool, str, str]:
-    """Run a command and return success status, stdout, and stderr."""
-    try:
-        # Use current environment if none provided
-        if env is None:
-            env = os.environ.copy()
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True, env=env)
-        return True, result.stdout, result.stderr
-    except subprocess.CalledProcessError as e:
-        return False, e.stdout, e.stderr
+
+OPR_KEYS = ['opr:hemisphere', 'opr:provider', 'opr:collection']
+
+# Matches year_location_platform collection names
+_YEAR_PATTERN = re.compile(r'^(\d{4})_([A-Za-z]+)_([A-Za-z0-9]+)')
+
+
+def most_common_value(column):
+    """Return the most frequent non-null value of an Arrow column, or None."""
+    counts = pc.value_counts(column.drop_null())
+    if len(counts) == 0:
+        return None
+    top = pc.index(counts.field('counts'), pc.max(counts.field('counts'))).as_py()
+    return counts[top]['values'].as_py()
 
 
 def extract_metadata_from_parquet(file_path: str) -> Dict:
@@ -54,43 +63,44 @@ def extract_metadata_from_parquet(file_path: str) -> Dict:
 
         if file_metadata:
             # Check for opr namespace metadata
-            for key in [b'opr:hemisphere', b'opr:provider', b'opr:collection']:
-                if key in file_metadata:
-                    extracted[key.decode('utf-8')] = file_metadata[key].decode('utf-8')
-
-        # If not found in file metadata, check the actual data
-        if not extracted:
-            df = pd.read_parquet(file_path)
+            for key in OPR_KEYS:
+                if key.encode('utf-8') in file_metadata:
+                    extracted[key] = file_metadata[key.encode('utf-8')].decode('utf-8')
+
+        # If not found in file metadata, check the actual data. Only the
+        # relevant columns of the first row group are read, since these
+        # values are the same for every row in a collection.
+        if not extracted and parquet_file.num_row_groups > 0:
+            columns = [c for c in OPR_KEYS + ['properties', 'collection']
+                       if c in parquet_file.schema_arrow.names]
+            table = parquet_file.read_row_group(0, columns=columns)
 
             # Check for opr namespace columns directly
-            for key in ['opr:hemisphere', 'opr:provider', 'opr:collection']:
-                if key in df.columns and len(df) > 0:
+            for key in OPR_KEYS:
+                if key in table.column_names and table.num_rows > 0:
                     # Get the most common value (should be same for all rows in a collection)
-                    value = df[key].mode()[0] if not df[key].isna().all() else None
+                    value = most_common_value(table.column(key))
                     if value:
                         extracted[key] = value
 
             # Check in properties column if it exists
-            if 'properties' in df.columns and len(df) > 0 and not extracted:
-                # Properties might be a dict/JSON column
-                first_props = df['properties'].iloc[0]
-                if isinstance(first_props, dict):
-                    for key in ['opr:hemisphere', 'opr:provider', 'opr:collection']:
-                        if key in first_props:
-                            extracted[key] = first_props[key]
-                elif isinstance(first_props, str):
+            if 'properties' in table.column_names and table.num_rows > 0 and not extracted:
+                # Properties might be a struct/JSON column
+                first_props = table.column('properties')[0].as_py()
+                if isinstance(first_props, str):
                     try:
-                        props_dict = json.loads(first_props)
-                        for key in ['opr:hemisphere', 'opr:provider', 'opr:collection']:
-                            if key in props_dict:
-                                extracted[key] = props_dict[key]
+                        first_props = json.loads(first_props)
                     except json.JSONDecodeError:
-                        pass
+                        first_props = None
+                if isinstance(first_props, dict):
+                    for key in OPR_KEYS:
+                        if first_props.get(key) is not None:
+                            extracted[key] = first_props[key]
 
             # Also check for standard STAC collection field
-            if 'collection' in df.columns and len(df) > 0:
-                collection_val = df['collection'].iloc[0]
-                if pd.notna(collection_val):
+            if 'collection' in table.column_names and table.num_rows > 0:
+                collection_val = table.column('collection')[0].as_py()
+                if collection_val is not None:
                     extracted['stac_collection'] = str(collection_val)
 
         return extracted
@@ -110,8 +120,7 @@ def extract_info_from_filename(filename: str) -> Dict:
     base_name = base_name.replace('_stac', '').replace('_catalog', '')
 
     # Try to match year_location_platform pattern
-    year_pattern = r'^(\d{4})_([A-Za-z]+)_([A-Za-z0-9]+)'
-    match = re.match(year_pattern, base_name)
+    match = _YEAR_PATTERN.match(base_name)
 
     if match:
         year, location, platform = match.groups()
@@ -124,16 +133,14 @@ def extract_info_from_filename(filename: str) -> Dict:
     return info
 
 
-def check_gcs_auth() -> bool:
+def check_gcs_auth(client) -> bool:
     """Check if GCS authentication is configured."""
     # Try to list the bucket
-    env = os.environ.copy()
-    cmd = ["gsutil", "ls", "gs://opr_stac/"]
-    success, _, stderr = run_command(cmd, env)
-
-    if not success:
+    try:
+        next(iter(client.list_blobs("opr_stac", max_results=1)), None)
+    except Exception as e:
         print("ERROR: Not authenticated to Google Cloud Storage")
-        print(f"Error details: {stderr}")
+        print(f"Error details: {e}")
         print("\nTo fix this, either:")
         print("1. Set service account: export GOOGLE_APPLICATION_CREDENTIALS='$HOME/opr-stac-key.json'")
         print("2. Or use gcloud: gcloud auth application-default login")
@@ -156,41 +163,32 @@ def build_gcs_path(hemisphere: str, provider: str, collection: str) -> str:
     return f"gs://opr_stac/catalog/hemisphere={hemisphere}/provider={provider}/collection={collection}/stac.parquet"
 
 
-def upload_file(local_path: str, gcs_path: str, dry_run: bool = True) -> bool:
-    """Upload a file to GCS."""
+def split_gcs_path(gcs_path: str) -> Tuple[str, str]:
+    """Split a gs://bucket/path URL into bucket name and blob name."""
+    bucket, _, blob = gcs_path.removeprefix("gs://").partition("/")
+    return bucket, blob
+
+
+def upload_file(local_path: str, gcs_path: str, dry_run: bool = True, client=None) -> bool:
+    """Upload a file to GCS using a shared storage client."""
     if dry_run:
         print(f"[DRY RUN] Would upload:")
         print(f"  FROM: {local_path}")
         print(f"    TO: {gcs_path}")
         return True
 
-    # Check for credentials and use them explicitly
-    env = os.environ.copy()
-    cred_path = env.get('GOOGLE_APPLICATION_CREDENTIALS')
-
-    if cred_path and os.path.exists(cred_path):
-        # Use gsutil with explicit service account key file
-        print(f"   Using credentials: {cred_path}")
-        cmd = [
-            "gsutil",
-            "-o", f"Credentials:gs_service_key_file={cred_path}",
-            "cp", local_path, gcs_path
-        ]
-    else:
-        # Fallback to default authentication
-        print("   Warning: No service account key found, using default authentication")
-        cmd = ["gsutil", "cp", local_path, gcs_path]
-
     print(f"Uploading: {local_path} -> {gcs_path}")
 
-    success, stdout, stderr = run_command(cmd, env)
-
-    if not success:
-        print(f"Error uploading {local_path}: {stderr}")
+    bucket_name, blob_name = split_gcs_path(gcs_path)
+    try:
+        client.bucket(bucket_name).blob(blob_name).upload_from_filename(local_path)
+    except Exception as e:
+        print(f"Error uploading {local_path}: {e}")
         # Additional debugging
-        if "Anonymous caller" in stderr:
+        if "Anonymous caller" in str(e):
+            cred_path = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
             print("\nDEBUG: Authentication issue detected!")
-            print(f"  GOOGLE_APPLICATION_CREDENTIALS={env.get('GOOGLE_APPLICATION_CREDENTIALS')}")
+            print(f"  GOOGLE_APPLICATION_CREDENTIALS={cred_path}")
             if cred_path:
                 print(f"  File exists at {cred_path}: {os.path.exists(cred_path)}")
                 if os.path.exists(cred_path):
@@ -201,8 +199,13 @@ def upload_file(local_path: str, gcs_path: str, dry_run: bool = True) -> bool:
     return True
 
 
-def process_directory(directory: str, dry_run: bool = True, verbose: bool = False):
-    """Process all parquet files in a directory and upload them to GCS."""
+def process_directory(directory: str, dry_run: bool = True, verbose: bool = False,
+                      jobs: int = 8, client=None):
+    """Process all parquet files in a directory and upload them to GCS.
+
+    Up to ``jobs`` uploads run concurrently, sharing ``client`` (a
+    ``google.cloud.storage.Client``) and its connection pool.
+    """
     directory_path = Path(directory)
 
     if not directory_path.exists():
@@ -218,16 +221,20 @@ def process_directory(directory: str, dry_run: bool = True, verbose: bool = Fals
 
     print(f"Found {len(parquet_files)} parquet files to process")
 
+    # Read metadata from all files concurrently; each read is I/O bound and
+    # pyarrow releases the GIL while reading
+    with ThreadPoolExecutor(max_workers=min(32, len(parquet_files))) as executor:
+        all_metadata = list(executor.map(extract_metadata_from_parquet,
+                                         map(str, parquet_files)))
+
     successful = 0
     failed = 0
     skipped = 0
+    uploads = []
 
-    for parquet_file in parquet_files:
+    for parquet_file, metadata in zip(parquet_files, all_metadata):
         print(f"\nProcessing: {parquet_file.name}")
 
-        # Extract metadata from parquet file
-        metadata = extract_metadata_from_parquet(str(parquet_file))
-
         # Extract info from filename as fallback
         file_info = extract_info_from_filename(parquet_file.name)
 
@@ -266,14 +273,20 @@ def process_directory(directory: str, dry_run: bool = True, verbose: bool = Fals
             skipped += 1
             continue
 
-        # Build GCS path
-        gcs_path = build_gcs_path(hemisphere, provider, collection)
-
-        # Upload file
-        if upload_file(str(parquet_file), gcs_path, dry_run):
-            successful += 1
-        else:
-            failed += 1
+        # Queue the upload to its GCS path
+        uploads.append((str(parquet_file), build_gcs_path(hemisphere, provider, collection)))
+
+    # Upload files concurrently; each upload mostly waits on the network.
+    # Dry runs stay sequential so their output is not interleaved.
+    max_workers = 1 if dry_run else max(1, min(jobs, len(uploads)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(upload_file, local_path, gcs_path, dry_run, client)
+                   for local_path, gcs_path in uploads]
+        for future in as_completed(futures):
+            if future.result():
+                successful += 1
+            else:
+                failed += 1
 
     print("\n" + "="*60)
     print("PROCESSING COMPLETE")
@@ -299,6 +312,8 @@ def main():
                         help="Actually execute the uploads (overrides --dry-run)")
     parser.add_argument("--verbose", action="store_true",
                         help="Print verbose output")
+    parser.add_argument("--jobs", type=int, default=8,
+                        help="Number of concurrent uploads (default: 8)")
 
     args = parser.parse_args()
 
@@ -306,9 +321,19 @@ def main():
     dry_run = not args.execute
 
     # Check authentication before processing (only for actual uploads)
+    client = None
     if not dry_run:
+        if storage is None:
+            print("Error: google-cloud-storage is required for uploads. "
+                  "Install with: pip install xopr[scripts]")
+            sys.exit(1)
+
         print("Checking GCS authentication...")
-        if not check_gcs_auth():
+        try:
+            client = storage.Client()
+        except Exception as e:
+            print(f"Error creating storage client: {e}")
+        if client is None or not check_gcs_auth(client):
             sys.exit(1)
         print("✅ Authentication successful\n")
 
@@ -322,7 +347,7 @@ def main():
         print("DRY RUN MODE - No files will be uploaded")
         print("="*60 + "\n")
 
-    process_directory(args.directory, dry_run, args.verbose)
+    process_directory(args.directory, dry_run, args.verbose, args.jobs, client)
 
     if dry_run:
         print("\nTo execute the actual uploads, run with --execute flag")
@@ -2,6 +2,7 @@
 # I just wanted something to quickly demonstrate what units might looks like.
 # Should be carefully reviewed.
 
+import dask
 import xarray as xr
 import numpy as np
 
@@ -20,8 +21,9 @@ def apply_cf_compliant_attrs(ds):
         Dataset with CF-compliant attributes applied.
     """
     
-    # Create a copy to avoid modifying the original dataset
-    ds_cf = ds.copy()
+    # Shallow copy: only attrs are modified, and xarray copies the attrs
+    # dicts on a shallow copy, so the original dataset is left untouched
+    ds_cf = ds.copy(deep=False)
     
     # Define CF-compliant attributes for coordinates
     coordinate_attrs = {
@@ -122,6 +124,16 @@ def apply_cf_compliant_attrs(ds):
         if var_name in ds_cf.data_vars:
             ds_cf[var_name].attrs.update(attrs)
     
+    # Evaluate the coordinate ranges together so dask-backed variables are
+    # reduced in a single compute instead of one pass per statistic
+    extent_vars = {'lat': 'Latitude', 'lon': 'Longitude', 'time': 'slow_time'}
+    reductions = {}
+    for key, var_name in extent_vars.items():
+        if var_name in ds_cf:
+            reductions[f'{key}_min'] = ds_cf[var_name].min()
+            reductions[f'{key}_max'] = ds_cf[var_name].max()
+    extents = dict(zip(reductions, dask.compute(*reductions.values())))
+
     # Add global attributes for CF compliance
     global_attrs = {
         'Conventions': 'CF-1.8',
@@ -131,12 +143,12 @@ def apply_cf_compliant_attrs(ds):
         'history': f'Converted to CF-compliant format on {np.datetime64("now").astype(str)}',
         'references': 'https://gitlab.com/openpolarradar/opr',
         'comment': 'Polar radar echogram data with CF-compliant metadata',
-        'geospatial_lat_min': float(ds_cf.Latitude.min()) if 'Latitude' in ds_cf else None,
-        'geospatial_lat_max': float(ds_cf.Latitude.max()) if 'Latitude' in ds_cf else None,
-        'geospatial_lon_min': float(ds_cf.Longitude.min()) if 'Longitude' in ds_cf else None,
-        'geospatial_lon_max': float(ds_cf.Longitude.max()) if 'Longitude' in ds_cf else None,
-        'time_coverage_start': str(ds_cf.slow_time.min().values) if 'slow_time' in ds_cf else None,
-        'time_coverage_end': str(ds_cf.slow_time.max().values) if 'slow_time' in ds_cf else None
+        'geospatial_lat_min': float(extents['lat_min']) if 'lat_min' in extents else None,
+        'geospatial_lat_max': float(extents['lat_max']) if 'lat_max' in extents else None,
+        'geospatial_lon_min': float(extents['lon_min']) if 'lon_min' in extents else None,
+        'geospatial_lon_max': float(extents['lon_max']) if 'lon_max' in extents else None,
+        'time_coverage_start': str(extents['time_min'].values) if 'time_min' in extents else None,
+        'time_coverage_end': str(extents['time_max'].values) if 'time_max' in extents else None
     }
     
     # Remove None values from global attributes
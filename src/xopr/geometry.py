@@ -1,9 +1,58 @@
+import functools
 import geopandas as gpd
+import hashlib
 import json
+import os
+import fsspec
+import numpy as np
 from cartopy import crs
 from pyproj import Transformer
 import shapely
-import shapely.ops
+
+@functools.lru_cache(maxsize=32)
+def _get_transformer(source_crs, target_crs):
+    """Return a (memoized) always_xy pyproj Transformer between two CRS strings."""
+    return Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_measures_boundaries(measures_boundaries_url, cache_dir=None):
+    """
+    Load the MEASURES boundaries GeoJSON, memoized per URL and cache directory.
+
+    If cache_dir is given, the downloaded file is also kept there so that
+    later Python sessions skip the download.
+    """
+    if cache_dir:
+        measures_boundaries_url = fsspec.open_local(
+            f"filecache::{measures_boundaries_url}",
+            filecache={'cache_storage': cache_dir}
+        )
+    return gpd.read_file(measures_boundaries_url, engine="pyogrio")
+
+
+def _union_regions(geometries):
+    """
+    Union an array of polygons, using GEOS coverage union when possible.
+
+    Coverage union is much faster than a general unary union but is only
+    correct for non-overlapping polygons with matching shared edges, which
+    MEASURES regions normally are. Inputs that are not a valid coverage, or
+    a GEOS too old to check, fall back to the general union.
+    """
+    try:
+        if shapely.coverage_is_valid(geometries):
+            return shapely.coverage_union_all(geometries)
+    except (AttributeError, shapely.errors.UnsupportedGEOSVersionError):
+        pass
+    return shapely.union_all(geometries)
+
+
+def _merged_regions_cache_path(cache_dir, **params):
+    """Path of the cached merged geometry for a set of get_antarctic_regions parameters."""
+    key = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:32]
+    return os.path.join(cache_dir, "regions", f"{key}.wkb")
+
 
 def get_antarctic_regions(
     name=None,
@@ -13,7 +62,8 @@ def get_antarctic_regions(
     merge_regions=True,
     measures_boundaries_url = "https://storage.googleapis.com/opr_stac/reference_geometry/measures_boundaries_4326.geojson",
     merge_in_projection="EPSG:3031",
-    simplify_tolerance=None
+    simplify_tolerance=None,
+    cache_dir=None
 ):
     """
     Load and filter Antarctic regional boundaries from the MEASURES dataset.
@@ -32,6 +82,11 @@ def get_antarctic_regions(
         If True, return a single merged geometry; if False, return list of geometries
     measures_boundaries_url : str, default "https://storage.googleapis.com/opr_stac/reference_geometry/measures_boundaries_4326.geojson"
         URL to the GeoJSON file containing Antarctic region boundaries
+    cache_dir : str, optional
+        Directory in which to keep a local copy of the boundaries file and of
+        merged geometries. The parsed file is always reused within a session;
+        with cache_dir set it is also reused across sessions, and merged
+        results are loaded from disk instead of being recomputed.
         
     Returns
     -------
@@ -52,29 +107,31 @@ def get_antarctic_regions(
     """
     
     
-    # Load the boundaries GeoJSON from the reference URL
-    filtered = gpd.read_file(measures_boundaries_url)
-    
-    # Apply filters based on provided parameters
-    if name is not None:
-        if isinstance(name, str):
-            name = [name]
-        filtered = filtered[filtered['NAME'].isin(name)]
+    # Reuse a previously merged result for the same parameters
+    merged_cache_path = None
+    if merge_regions and cache_dir:
+        merged_cache_path = _merged_regions_cache_path(
+            cache_dir, url=measures_boundaries_url, name=name, regions=regions,
+            subregions=subregions, type=type, merge_in_projection=merge_in_projection,
+            simplify_tolerance=simplify_tolerance
+        )
+        if os.path.exists(merged_cache_path):
+            with open(merged_cache_path, 'rb') as f:
+                return shapely.from_wkb(f.read())
+
+    # Load the boundaries GeoJSON from the reference URL (memoized, so the
+    # cached frame is only ever indexed, never modified)
+    boundaries = _load_measures_boundaries(measures_boundaries_url, cache_dir)
     
-    if regions is not None:
-        if isinstance(regions, str):
-            regions = [regions] 
-        filtered = filtered[filtered['Regions'].isin(regions)]
-        
-    if subregions is not None:
-        if isinstance(subregions, str):
-            subregions = [subregions]
-        filtered = filtered[filtered['Subregions'].isin(subregions)]
-        
-    if type is not None:
-        if isinstance(type, str):
-            type = [type]
-        filtered = filtered[filtered['TYPE'].isin(type)]
+    # Combine all filters into one boolean mask and select rows once
+    mask = np.ones(len(boundaries), dtype=bool)
+    for field, values in (('NAME', name), ('Regions', regions),
+                          ('Subregions', subregions), ('TYPE', type)):
+        if values is not None:
+            if isinstance(values, str):
+                values = [values]
+            mask &= boundaries[field].isin(values).to_numpy()
+    filtered = boundaries[mask].copy()
     
     if len(filtered) == 0:
         return [] if not merge_regions else None
@@ -84,16 +141,17 @@ def get_antarctic_regions(
         if merge_in_projection:
             filtered = filtered.to_crs(merge_in_projection)
 
-        # Check for invalid regions and attempt to fix them
-        invalid_geometries = filtered[~filtered.is_valid]
-        if len(invalid_geometries) > 0:
-            filtered = filtered.make_valid()
-            print(f"Warning: {len(invalid_geometries)} invalid geometries were fixed before merging.")
+        # Check for invalid regions and fix only those
+        geometries = np.array(filtered.geometry.array)
+        invalid = ~shapely.is_valid(geometries)
+        if invalid.any():
+            geometries[invalid] = shapely.make_valid(geometries[invalid])
+            print(f"Warning: {invalid.sum()} invalid geometries were fixed before merging.")
             if merge_in_projection != "EPSG:3031":
                 print("Consider using merge_in_projection='EPSG:3031' to reproject before merging.")
-            print(f"Invalid geometry regions were: {', '.join(invalid_geometries['NAME'])}")
+            print(f"Invalid geometry regions were: {', '.join(filtered['NAME'][invalid])}")
 
-        merged = filtered.union_all()
+        merged = _union_regions(geometries)
 
         if simplify_tolerance is None and (merge_in_projection == "EPSG:3031"): # Set a reasonable default based on the size
             area_km2 = merged.area / 1e6
@@ -114,6 +172,13 @@ def get_antarctic_regions(
         if merge_in_projection:
             merged = project_geojson(merged, source_crs=merge_in_projection, target_crs="EPSG:4326")
 
+        if merged_cache_path:
+            os.makedirs(os.path.dirname(merged_cache_path), exist_ok=True)
+            tmp_path = f"{merged_cache_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(shapely.to_wkb(merged))
+            os.replace(tmp_path, merged_cache_path)
+
         return merged
     else:
         return filtered
@@ -151,7 +216,7 @@ def project_dataset(ds, target_crs):
     else:
         target_crs_str = target_crs.to_proj4_string()
     
-    transformer = Transformer.from_crs("EPSG:4326", target_crs_str, always_xy=True)
+    transformer = _get_transformer("EPSG:4326", target_crs_str)
     projected_coords = transformer.transform(ds['Longitude'].values, ds['Latitude'].values)
     
     ds = ds.assign_coords({
@@ -188,6 +253,14 @@ def project_geojson(geometry, source_crs="EPSG:4326", target_crs="EPSG:3031"):
     >>> point = Point(-70, -75)  # lon, lat in WGS84
     >>> projected = project_geojson(point, "EPSG:4326", "EPSG:3031")
     """
-    transformer = Transformer.from_crs(source_crs, target_crs, always_xy=True)
-    projected_geometry = shapely.ops.transform(transformer.transform, geometry)
+    transformer = _get_transformer(source_crs, target_crs)
+
+    # Transform all coordinates in one vectorized call rather than a Python
+    # callback per coordinate, keeping Z values if the geometry has them
+    include_z = bool(np.any(shapely.has_z(geometry)))
+    projected_geometry = shapely.transform(
+        geometry,
+        lambda coords: np.column_stack(transformer.transform(*coords.T)),
+        include_z=include_z
+    )
     return projected_geometry
\ No newline at end of file
@@ -1,20 +1,30 @@
-from collections.abc import Iterable
 import h5py
 import scipy.io
 import numpy as np
+import warnings
 
 #
 # HDF5-format MATLAB files
 #
 
-def dereference_h5value(value, h5file, make_array=True):
+def dereference_h5value(value, h5file, make_array=True, memo=None):
     if isinstance(value, h5py.Reference):
-        return dereference_h5value(h5file[value], h5file=h5file)
+        target = h5file[value]
+        if memo is None:
+            return dereference_h5value(target, h5file=h5file)
+        # The same object is often referenced from many cells; decode it once
+        # (object IDs of the same HDF5 object compare and hash equal)
+        if target.id not in memo:
+            memo[target.id] = dereference_h5value(target, h5file=h5file, memo=memo)
+        return memo[target.id]
     elif isinstance(value, h5py.Group):
         # Pass back to decode_hdf5_matlab_variable to handle groups
-        return decode_hdf5_matlab_variable(value, h5file=h5file)
-    elif isinstance(value, Iterable):
-        v = [dereference_h5value(v, h5file=h5file) for v in value]
+        return decode_hdf5_matlab_variable(value, h5file=h5file, memo=memo)
+    elif isinstance(value, h5py.Dataset):
+        # Read the referenced dataset in one call instead of row by row
+        return dereference_h5value(value[()], h5file=h5file, make_array=make_array, memo=memo)
+    elif isinstance(value, np.ndarray):
+        v = [dereference_h5value(v, h5file=h5file, memo=memo) for v in value]
         if make_array:
             try:
                 return np.squeeze(np.array(v))
@@ -27,32 +37,42 @@ def dereference_h5value(value, h5file, make_array=True):
     else:
         return value
 
-def decode_hdf5_matlab_variable(h5var, skip_variables=False, debug_path="", skip_errors=True, h5file=None):
+def decode_hdf5_matlab_variable(h5var, skip_variables=False, debug_path="", skip_errors=True, h5file=None, memo=None):
     """
     Decode a MATLAB variable stored in an HDF5 file.
     This function assumes the variable is stored as a byte string.
+
+    ``memo`` caches decoded reference targets for the duration of one
+    top-level call, so objects shared between cells are decoded once.
     """
     if h5file is None:
         h5file = h5var.file
-    matlab_class = h5var.attrs.get('MATLAB_class', None)
+    if memo is None:
+        memo = {}
+    # Look up only the attributes needed; reading every attribute would
+    # decode ones that are never used
+    h5attrs = h5var.attrs
+    matlab_class = h5attrs.get('MATLAB_class', None)
     
     # Handle MATLAB_class as either bytes or string
     if matlab_class and (matlab_class == b'cell' or matlab_class == 'cell'):
-        return dereference_h5value(h5var[:], h5file=h5file, make_array=False)
+        return dereference_h5value(h5var[()], h5file=h5file, make_array=False, memo=memo)
     elif matlab_class and (matlab_class == b'char' or matlab_class == 'char'):
         # Check if this is an empty MATLAB char array
-        if h5var.attrs.get('MATLAB_empty', 0):
+        if h5attrs.get('MATLAB_empty', 0):
             return ''
         
         # MATLAB stores char arrays as uint16 (Unicode code points)
         # or sometimes uint8 (ASCII). Handle both cases properly.
-        data = h5var[:]
+        data = h5var[()]
         
         if data.dtype == np.dtype('uint16'):
-            # Each uint16 value is a Unicode code point (UCS-2/UTF-16)
-            # Convert to string by treating each value as a character code
-            chars = [chr(c) for c in data.flatten() if c != 0]
-            return ''.join(chars).rstrip()
+            # Each uint16 value is a UTF-16 code unit; decode the non-null
+            # units in a single call
+            code_units = data[data != 0].astype('<u2')
+            if code_units.size == 0:
+                return ''
+            return code_units.tobytes().decode('utf-16-le', errors='surrogatepass').rstrip()
         elif data.dtype == np.dtype('uint8'):
             # uint8 data can be decoded directly as UTF-8
             return data.tobytes().decode('utf-8').rstrip('\x00')
@@ -76,22 +96,25 @@ def decode_hdf5_matlab_variable(h5var, skip_variables=False, debug_path="", skip
             if 'api_key' in k:
                 attrs[k] = "API_KEY_REMOVED"
                 continue
-            if isinstance(h5var[k], h5py.Dataset):
+            # Open each child object once; every h5var[k] lookup is an HDF5 open
+            child = h5var[k]
+            if isinstance(child, h5py.Dataset):
                 if not skip_variables:
                     try:
-                        attrs[k] = decode_hdf5_matlab_variable(h5var[k], debug_path=debug_path + "/" + k, skip_errors=skip_errors, h5file=h5file)
+                        attrs[k] = decode_hdf5_matlab_variable(child, debug_path=debug_path + "/" + k, skip_errors=skip_errors, h5file=h5file, memo=memo)
                     except Exception as e:
                         print(f"Failed to decode variable {k} at {debug_path}: {e}")
                         if not skip_errors:
                             raise e
             else:
-                attrs[k] = decode_hdf5_matlab_variable(h5var[k], debug_path=debug_path + "/" + k, skip_errors=skip_errors, h5file=h5file)
+                attrs[k] = decode_hdf5_matlab_variable(child, debug_path=debug_path + "/" + k, skip_errors=skip_errors, h5file=h5file, memo=memo)
         return attrs
     elif isinstance(h5var, h5py.Dataset):
-        if h5var.dtype == 'O':
-            return dereference_h5value(h5var[:], h5file=h5file)
+        data = h5var[()]
+        if data.dtype == 'O':
+            return dereference_h5value(data, h5file=h5file, memo=memo)
         else:
-            return np.squeeze(h5var[:])
+            return np.squeeze(data)
     else:
         return h5var[:]
 
@@ -109,30 +132,45 @@ def extract_legacy_mat_attributes(file, skip_keys=[], skip_errors=True):
         else:
             attrs[key] = value
 
-    attrs = strip_api_key(attrs)
-    attrs = convert_object_ndarrays_to_lists(attrs)
-    return attrs
+    return clean_attrs(attrs)
 
-def strip_api_key(attrs):
+def clean_attrs(attrs):
+    """
+    Return a copy of a nested attribute dict ready for use as dataset attrs.
+
+    In a single walk of the tree, values whose key contains 'api_key' are
+    replaced with a placeholder and object ndarrays are converted to lists.
+    """
     attrs_clean = {}
-    for key, value in attrs.items():
-        if 'api_key' in key:
-            attrs_clean[key] = "API_KEY_REMOVED"
-        elif isinstance(value, dict):
-            attrs_clean[key] = strip_api_key(value)
-        else:
-            attrs_clean[key] = value
+    stack = [(attrs, attrs_clean)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if 'api_key' in key:
+                target[key] = "API_KEY_REMOVED"
+            elif isinstance(value, dict):
+                target[key] = {}
+                stack.append((value, target[key]))
+            elif isinstance(value, np.ndarray) and value.dtype == 'object':
+                target[key] = value.tolist()
+            else:
+                target[key] = value
     return attrs_clean
 
+def strip_api_key(attrs):
+    """
+    Deprecated: use clean_attrs, which this now calls (so object ndarrays
+    are also converted to lists).
+    """
+    warnings.warn("strip_api_key is deprecated, use clean_attrs instead",
+                  DeprecationWarning, stacklevel=2)
+    return clean_attrs(attrs)
+
 def convert_object_ndarrays_to_lists(attrs):
     """
-    Convert any object ndarray attributes to lists.
+    Deprecated: use clean_attrs, which this now calls (so api_key values are
+    also removed, and a cleaned copy is returned).
     """
-    for key, value in attrs.items():
-        if isinstance(value, np.ndarray) and value.dtype == 'object':
-            attrs[key] = value.tolist()
-        elif isinstance(value, dict):
-            convert_object_ndarrays_to_lists(value)
-        else:
-            attrs[key] = value
-    return attrs
\ No newline at end of file
+    warnings.warn("convert_object_ndarrays_to_lists is deprecated, use clean_attrs instead",
+                  DeprecationWarning, stacklevel=2)
+    return clean_attrs(attrs)
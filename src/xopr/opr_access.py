@@ -1,3 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import functools
+from operator import itemgetter
+import os
 from typing import Iterable, Optional, Union
 import warnings
 import xarray as xr
@@ -6,20 +11,58 @@ import pandas as pd
 import numpy as np
 import requests
 import re
+import urllib.parse
 import json
+import hashlib
 import scipy.io
 import geopandas as gpd
 import shapely
 import h5py
+import h5netcdf
 import antimeridian
 from rustac import DuckdbClient
 
 from .cf_units import apply_cf_compliant_attrs
 from .matlab_attribute_utils import decode_hdf5_matlab_variable, extract_legacy_mat_attributes
-from .util import merge_dicts_no_conflicts
+from .util import merge_dicts_no_conflicts, seconds_to_datetime64
 from . import ops_api
 from . import opr_tools
 
+# Matches <collection>/<data product>/<segment>/<prefix><granule> in frame URLs
+_FRAME_URL_PATTERN = re.compile(r'(\d{4}_\w+_[A-Za-z0-9]+)\/([\w_]+)\/[\d_]+\/[\w]+(\d{8}_\d{2}_\d{3})')
+
+# Whether each HTTP(S) host answers range requests, as found by probing it
+_range_request_support = {}
+
+def _supports_range_requests(url: str) -> bool:
+    """
+    Return whether byte ranges of a remote file can be read.
+
+    HTTP(S) servers are probed once per host with a one byte range request;
+    fsspec file objects report themselves seekable whether or not the server
+    honours ranges, so that can't be used instead. Other protocols (e.g.
+    gs://, s3://) always support ranges. Failed probes are not remembered.
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ('http', 'https'):
+        return True
+
+    supported = _range_request_support.get(parts.netloc)
+    if supported is None:
+        try:
+            with requests.get(url, headers={'Range': 'bytes=0-0'}, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                supported = response.status_code == 206
+        except requests.RequestException:
+            return False
+        _range_request_support[parts.netloc] = supported
+    return supported
+
+@functools.lru_cache(maxsize=8)
+def _get_collections(stac_parquet_href: str) -> list:
+    """Return the collections of a STAC GeoParquet catalog, memoized per catalog."""
+    return DuckdbClient().get_collections(stac_parquet_href)
+
 class OPRConnection:
     def __init__(self,
                  collection_url: str = "https://data.cresis.ku.edu/data/",
@@ -48,6 +91,11 @@ class OPRConnection:
             }
             self.fsspec_url_prefix = 'filecache::'
 
+        # Block size for byte-range reads of uncached frames
+        self.frame_block_size = 4 * 1024 * 1024
+        # Blocks kept per open frame, bounding each frame's read cache
+        self.frame_max_blocks = 4
+
     def query_frames(self, collections: list[str] = None, segment_paths: list[str] = None,
                      geometry = None, date_range: tuple = None, properties: dict = {},
                      max_items: int = None, exclude_geometry: bool = False,
@@ -147,7 +195,7 @@ class OPRConnection:
                     }
                     segment_conditions.append(segment_condition)
                 except ValueError:
-                    print(f"Warning: Invalid segment_path format '{segment_path}'. Expected format: YYYYMMDD_NN")
+                    warnings.warn(f"Invalid segment_path format '{segment_path}'. Expected format: YYYYMMDD_NN", UserWarning)
                     continue
 
             if segment_conditions:
@@ -215,10 +263,15 @@ class OPRConnection:
                     data_product: str = "CSARP_standard",
                     merge_flights: bool = False,
                     skip_errors: bool = False,
+                    max_workers: int = 8,
+                    chunks=None,
                     ) -> Union[list[xr.Dataset], xr.Dataset]:
         """
         Load multiple radar frames from a list of STAC items.
 
+        Frames are downloaded and loaded concurrently on a thread pool, since
+        loading is dominated by waiting on the network.
+
         Parameters
         ----------
         stac_items : gpd.GeoDataFrame
@@ -227,8 +280,16 @@ class OPRConnection:
             The data product to load (default is "CSARP_standard").
         merge_flights : bool, optional
             Whether to merge frames from the same flight (default is False).
+            Frames are read into memory and their files closed before
+            merging; combined with chunks, the merged flight is instead a
+            single lazy dask-backed Dataset. See opr_tools.merge_frames.
         skip_errors : bool, optional
             Whether to skip errors and continue loading other frames (default is False).
+        max_workers : int, optional
+            Maximum number of frames to load at the same time (default is 8).
+        chunks : optional
+            If given, each frame is returned as a dask-backed Dataset with
+            these chunks. See load_frame_url.
 
         Returns
         -------
@@ -237,23 +298,68 @@ class OPRConnection:
         """
         frames = []
 
-        for idx, item in stac_items.iterrows():
-            try:
-                frame = self.load_frame(item, data_product)
-                frames.append(frame)
-            except Exception as e:
-                print(f"Error loading frame for item {item.get('id', 'unknown')}: {e}")
-                if skip_errors:
-                    continue
-                else:
-                    raise e
+        items = [item for _, item in stac_items.iterrows()]
+        segment_keys = [self._segment_key(item, data_product) for item in items]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+            # Request the OPS metadata of each segment once, concurrently, and
+            # hand it to the frames of that segment, so that frames never
+            # issue the same request themselves
+            metadata_futures = {key: executor.submit(ops_api.get_segment_metadata, *key)
+                                for key in set(segment_keys) if key}
+            segment_metadata = {}
+            for key, future in metadata_futures.items():
+                try:
+                    segment_metadata[key] = future.result() or {}
+                except Exception:
+                    pass  # Each frame of the segment retries the request
+
+            futures = [executor.submit(self.load_frame, item, data_product, chunks=chunks,
+                                       segment_metadata=segment_metadata.get(key))
+                       for item, key in zip(items, segment_keys)]
+
+            # Collect results in the original item order
+            for item, future in zip(items, futures):
+                try:
+                    frames.append(future.result())
+                except Exception as e:
+                    if skip_errors:
+                        warnings.warn(f"Error loading frame for item {item.get('id', 'unknown')}: {e}", UserWarning)
+                        continue
+                    else:
+                        for pending in futures:
+                            pending.cancel()
+                        raise e
 
         if merge_flights:
-            return opr_tools.merge_flights_from_frames(frames)
+            if chunks is None:
+                # Merging reads every frame into memory anyway, so do it up
+                # front and close the frame files instead of leaving them
+                # open (and their read caches alive) until garbage collection
+                for frame in frames:
+                    frame.load()
+                    frame.close()
+            return opr_tools.merge_frames(frames)
         else:
             return frames
 
-    def load_frame(self, stac_item, data_product: str = "CSARP_standard") -> xr.Dataset:
+    def _segment_key(self, stac_item, data_product: str) -> Optional[tuple]:
+        """
+        Return the (segment_path, collection) pair of a STAC item's frame URL,
+        as used for OPS segment metadata lookups, or None if it has none.
+        """
+        assets = stac_item.get('assets')
+        if not isinstance(assets, dict):
+            return None  # load_frame reports missing assets
+        url = (assets.get(data_product) or {}).get('href')
+        match = _FRAME_URL_PATTERN.search(url) if url else None
+        if not match:
+            return None
+        collection, _, granule = match.groups()
+        date, segment_id, _ = granule.split('_')
+        return f"{date}_{segment_id}", collection
+
+    def load_frame(self, stac_item, data_product: str = "CSARP_standard", chunks=None,
+                   segment_metadata: dict = None) -> xr.Dataset:
         """
         Load a radar frame from a STAC item.
 
@@ -263,6 +369,11 @@ class OPRConnection:
             The STAC item containing asset URLs.
         data_product : str, optional
             The data product to load (default is "CSARP_standard").
+        chunks : optional
+            If given, return a dask-backed Dataset with these chunks. See
+            load_frame_url.
+        segment_metadata : dict, optional
+            OPS metadata of the frame's segment. See load_frame_url.
 
         Returns
         -------
@@ -284,9 +395,9 @@ class OPRConnection:
             raise ValueError(f"No href found in {data_product} asset")
         
         # Load the frame using the existing method
-        return self.load_frame_url(url)
+        return self.load_frame_url(url, chunks=chunks, segment_metadata=segment_metadata)
 
-    def load_frame_url(self, url: str) -> xr.Dataset:
+    def load_frame_url(self, url: str, chunks=None, segment_metadata: dict = None) -> xr.Dataset:
         """
         Load a radar frame from a given URL.
 
@@ -294,6 +405,15 @@ class OPRConnection:
         ----------
         url : str
             The URL of the radar frame data.
+        chunks : optional
+            If given, the frame's arrays are wrapped in dask arrays with these
+            chunks (anything accepted by xarray.Dataset.chunk, using the
+            'slow_time' and 'twtt' dimension names), so data is only read
+            when computed. HDF5 frames are read lazily either way; this
+            additionally allows out-of-core and parallel computation.
+        segment_metadata : dict, optional
+            Response of ops_api.get_segment_metadata for the frame's segment,
+            used for the citation attributes. Requested from OPS if not given.
 
         Returns
         -------
@@ -301,73 +421,132 @@ class OPRConnection:
             The loaded radar frame as an xarray Dataset.
         """
         
-        if self.fsspec_url_prefix:
-            file = fsspec.open_local(f"{self.fsspec_url_prefix}{url}", filecache=self.fsspec_cache_kwargs)
-        else:
-            file = fsspec.open_local(f"simplecache::{url}", **self.fsspec_cache_kwargs)
-
+        file = self._open_frame_file(url)
+        owns_file = not isinstance(file, (str, os.PathLike))
 
         filetype = None
+        loaded = None
         try:
-            ds = self._load_frame_hdf5(file)
-            filetype = 'hdf5'
-        except OSError:
-            ds = self._load_frame_matlab(file)
-            filetype = 'matlab'
-
-        # Add the source URL as an attribute
-        ds.attrs['source_url'] = url
+            try:
+                ds = loaded = self._load_frame_hdf5(file)
+                filetype = 'hdf5'
+            except OSError:
+                if hasattr(file, 'seek'):
+                    file.seek(0)
+                ds = self._load_frame_matlab(file)
+                filetype = 'matlab'
+
+            if chunks is not None:
+                ds = ds.chunk(chunks)
+
+            # Add the source URL as an attribute
+            ds.attrs['source_url'] = url
+
+            # Apply CF-compliant attributes
+            ds = apply_cf_compliant_attrs(ds)
+
+            # Get the season and segment from the URL
+            match = _FRAME_URL_PATTERN.search(url)
+            if match:
+                collection, data_product, granule = match.groups()
+                date, segment_id, frame_id = granule.split('_')
+                ds.attrs.update({
+                    'collection': collection,
+                    'data_product': data_product,
+                    'granule': granule,
+                    'segment_path': f"{date}_{segment_id}",
+                    'date_str': date,
+                    'segment': int(segment_id),
+                    'frame': int(frame_id),
+                })
+
+                # Load citation information
+                result = segment_metadata
+                if result is None:
+                    result = ops_api.get_segment_metadata(segment_name=ds.attrs['segment_path'], season_name=collection)
+                if result:
+                    if isinstance(result['data'], str):
+                        warnings.warn(f"Warning: Unexpected result from ops_api: {result['data']}", UserWarning)
+                    else:
+                        result_data = {}
+                        for key, value in result['data'].items():
+                            if len(value) == 1:
+                                result_data[key] = value[0]
+                            elif len(value) > 1:
+                                result_data[key] = set(value)
+
+                        # Citation attributes, keyed by their OPS metadata names
+                        citation_keys = {'dois': 'doi', 'rors': 'ror', 'funding_sources': 'funder_text'}
+                        ds.attrs.update({attr: result_data[key] for key, attr in citation_keys.items()
+                                         if key in result_data})
+
+            # Add the rest of the Matlab parameters
+            if filetype == 'hdf5':
+                ds.attrs['mimetype'] = 'application/x-hdf5'
+                with h5py.File(file, 'r') as h5:
+                    ds.attrs.update(decode_hdf5_matlab_variable(h5,
+                                                                skip_variables=True,
+                                                                skip_errors=True))
+            elif filetype == 'matlab':
+                ds.attrs['mimetype'] = 'application/x-matlab-data'
+                ds.attrs.update(extract_legacy_mat_attributes(file,
+                                                              skip_keys=ds.keys(),
+                                                              skip_errors=True))
+        except BaseException:
+            if loaded is not None:
+                loaded.close()
+            if owns_file:
+                file.close()
+            raise
 
-        # Apply CF-compliant attributes
-        ds = apply_cf_compliant_attrs(ds)
-
-        # Get the season and segment from the URL
-        match = re.search(r'(\d{4}_\w+_[A-Za-z0-9]+)\/([\w_]+)\/[\d_]+\/[\w]+(\d{8}_\d{2}_\d{3})', url)
-        if match:
-            collection, data_product, granule = match.groups()
-            date, segment_id, frame_id = granule.split('_')
-            ds.attrs['collection'] = collection
-            ds.attrs['data_product'] = data_product
-            ds.attrs['granule'] = granule
-            ds.attrs['segment_path'] = f"{date}_{segment_id}"
-            ds.attrs['date_str'] = date
-            ds.attrs['segment'] = int(segment_id)
-            ds.attrs['frame'] = int(frame_id)
-
-            # Load citation information
-            result = ops_api.get_segment_metadata(segment_name=ds.attrs['segment_path'], season_name=collection)
-            if result:
-                if isinstance(result['data'], str):
-                    warnings.warn(f"Warning: Unexpected result from ops_api: {result['data']}", UserWarning)
-                else:
-                    result_data = {}
-                    for key, value in result['data'].items():
-                        if len(value) == 1:
-                            result_data[key] = value[0]
-                        elif len(value) > 1:
-                            result_data[key] = set(value)
-
-                    if 'dois' in result_data:
-                        ds.attrs['doi'] = result_data['dois']
-                    if 'rors' in result_data:
-                        ds.attrs['ror'] = result_data['rors']
-                    if 'funding_sources' in result_data:
-                        ds.attrs['funder_text'] = result_data['funding_sources']
-
-        # Add the rest of the Matlab parameters
         if filetype == 'hdf5':
-            ds.attrs['mimetype'] = 'application/x-hdf5'
-            ds.attrs.update(decode_hdf5_matlab_variable(h5py.File(file, 'r'),
-                                                        skip_variables=True,
-                                                        skip_errors=True))
-        elif filetype == 'matlab':
-            ds.attrs['mimetype'] = 'application/x-matlab-data'
-            ds.attrs.update(extract_legacy_mat_attributes(file,
-                                                          skip_keys=ds.keys(),
-                                                          skip_errors=True))
+            # HDF5 frames are read lazily, so the returned Dataset owns the
+            # open file (and any remote file handle beneath it) until closed
+            def close():
+                loaded.close()
+                if owns_file:
+                    file.close()
+            ds.set_close(close)
+        elif owns_file:
+            file.close()  # MATLAB frames are fully read into memory
 
         return ds
     
+    def _open_frame_file(self, url: str):
+        """
+        Open a radar frame for reading.
+
+        Local paths are returned as is. For remote files with a cache
+        directory configured, the whole file is downloaded into the cache and
+        its local path is returned. Otherwise, if the server supports range
+        requests, a seekable, block-cached file object is returned so that
+        only the byte ranges actually read (e.g. by h5netcdf) are fetched;
+        the caller is responsible for closing it. Servers that do not support
+        range requests fall back to downloading a temporary copy.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the radar frame data.
+
+        Returns
+        -------
+        str or file-like
+            A local path or an open binary file object.
+        """
+        # Local files are opened directly, without copying them into a cache
+        local_path = url.removeprefix('file://')
+        if '://' not in local_path and os.path.isfile(local_path):
+            return local_path
+
+        if self.fsspec_url_prefix:
+            return fsspec.open_local(f"{self.fsspec_url_prefix}{url}", filecache=self.fsspec_cache_kwargs)
+
+        if _supports_range_requests(url):
+            return fsspec.open(url, mode='rb', cache_type='blockcache', block_size=self.frame_block_size,
+                               cache_options={'maxblocks': self.frame_max_blocks}).open()
+        return fsspec.open_local(f"simplecache::{url}", **self.fsspec_cache_kwargs)
+
     def _load_frame_hdf5(self, file) -> xr.Dataset:
         """
         Load a radar frame from an HDF5 file.
@@ -375,7 +554,8 @@ class OPRConnection:
         Parameters
         ----------
         file : 
-            The path to the HDF5 file containing radar frame data.
+            The path to, or an open binary file object for, the HDF5 file
+            containing radar frame data.
 
         Returns
         -------
@@ -383,39 +563,48 @@ class OPRConnection:
             The loaded radar frame as an xarray Dataset.
         """
 
-        ds = xr.open_dataset(file, engine='h5netcdf', phony_dims='sort')
+        # MATLAB files carry no CF encoding, so skip xarray's CF decoding pass;
+        # GPS time is converted to datetime explicitly below
+        if isinstance(file, (str, os.PathLike)):
+            raw = xr.open_dataset(file, engine='h5netcdf', phony_dims='sort', decode_cf=False)
+        else:
+            # xarray rejects file objects that do not start with the HDF5
+            # signature, but MATLAB v7.3 files begin with a 512 byte header.
+            # Opening through h5netcdf handles the header and raises OSError
+            # for non-HDF5 files, like opening a path does.
+            store = xr.backends.H5NetCDFStore(h5netcdf.File(file, 'r', phony_dims='sort'))
+            raw = xr.open_dataset(store, decode_cf=False)
 
         # Re-arrange variables to provide useful dimensions and coordinates
 
-        ds = ds.squeeze() # Drop the singleton dimensions matlab adds
+        ds = raw.squeeze() # Drop the singleton dimensions matlab adds
 
-        ds = ds.rename({ # Label the dimensions with more useful names
-            ds.Data.dims[0]: 'slow_time_idx',
-            ds.Data.dims[1]: 'twtt_idx',
-        })
+        # Dimensions of the radar data: (slow time, two-way travel time)
+        slow_time_dim, twtt_dim = ds.Data.dims
+
+        # Make variables with no dimensions into scalar attributes. Work on the
+        # underlying Variables; ds[var] would build a DataArray for each one
+        variables = ds.variables
+        scalars = [var for var in ds.data_vars if variables[var].ndim == 0]
+        ds.attrs.update({var: variables[var].values.item() for var in scalars})
 
-        # Make variables with no dimensions into scalar attributes
-        for var in ds.data_vars:
-            if ds[var].ndim == 0:
-                ds.attrs[var] = ds[var].item()
-                ds = ds.drop_vars(var)
-        
         # Make the file_type an attribute
-        if 'file_type' in ds.data_vars:
+        if 'file_type' in ds.data_vars and 'file_type' not in scalars:
             ds.attrs['file_type'] = ds['file_type'].to_numpy()
-            ds = ds.drop_vars('file_type')
-
-        # Name the two time coordinates
-        ds = ds.rename({'Time': 'twtt', 'GPS_time': 'slow_time'})
-        ds = ds.set_coords(['slow_time', 'twtt'])
-
-        slow_time_1d = pd.to_datetime(ds['slow_time'].values, unit='s')
-        ds = ds.assign_coords(slow_time=('slow_time_idx', slow_time_1d))
-
-        # Make twtt and slow_time the indexing coordinates
-        ds = ds.swap_dims({'twtt_idx': 'twtt'})
-        ds = ds.swap_dims({'slow_time_idx': 'slow_time'})
-
+            scalars.append('file_type')
+
+        # Replace the two time variables with indexing coordinates named after
+        # the dimensions. Everything is dropped, renamed and assigned in three
+        # calls rather than a chain of rename/set_coords/swap_dims steps that
+        # each rebuild the Dataset.
+        twtt = ('twtt', ds['Time'].values, ds['Time'].attrs)
+        slow_time = ('slow_time', seconds_to_datetime64(ds['GPS_time'].values))
+        ds = ds.drop_vars(scalars + ['Time', 'GPS_time'])
+        ds = ds.rename_dims({slow_time_dim: 'slow_time', twtt_dim: 'twtt'})
+        ds = ds.assign_coords(slow_time=slow_time, twtt=twtt)
+
+        # Keep the open file closable from the rearranged Dataset
+        ds.set_close(raw.close)
         return ds
     
     def _load_frame_matlab(self, file) -> xr.Dataset:
@@ -454,7 +643,7 @@ class OPRConnection:
             },
             coords={
                 'twtt': ('twtt', np.squeeze(m['Time'])),
-                'slow_time': ('slow_time', pd.to_datetime(np.squeeze(m['GPS_time']), unit='s')),
+                'slow_time': ('slow_time', seconds_to_datetime64(np.squeeze(m['GPS_time']))),
             }
         )
 
@@ -464,14 +653,16 @@ class OPRConnection:
         """
         Get list of available STAC collections.
 
+        The collections are read from the catalog once per session; repeated
+        calls return copies of the cached result.
+
         Returns
         -------
         list
             List of collection dictionaries with metadata.
         """
 
-        client = DuckdbClient()
-        return client.get_collections(self.stac_parquet_href)
+        return copy.deepcopy(_get_collections(self.stac_parquet_href))
 
     def get_segments(self, collection_id: str) -> list:
         """
@@ -494,18 +685,20 @@ class OPRConnection:
             print(f"No items found in collection '{collection_id}'")
             return []
 
-        # Group items by segment (opr:date + opr:segment)
+        # Group items by segment (opr:date + opr:segment). Only the properties
+        # column is needed, so iterate it directly rather than building a
+        # Series per row with iterrows
         segments = {}
-        for idx, item in items.iterrows():
-            properties = item['properties']
+        for properties in items['properties']:
             date = properties['opr:date']
             flight_num = properties['opr:segment']
             
             if date and flight_num is not None:
                 segment_path = f"{date}_{flight_num:02d}"
 
-                if segment_path not in segments:
-                    segments[segment_path] = {
+                segment = segments.get(segment_path)
+                if segment is None:
+                    segment = segments[segment_path] = {
                         'segment_path': segment_path,
                         'date': date,
                         'flight_number': flight_num,
@@ -514,12 +707,12 @@ class OPRConnection:
                         'item_count': 0
                     }
 
-                segments[segment_path]['frames'].append(properties.get('opr:frame'))
-                segments[segment_path]['item_count'] += 1
+                segment['frames'].append(properties.get('opr:frame'))
+                segment['item_count'] += 1
 
         # Sort segments by date and flight number
         segment_list = list(segments.values())
-        segment_list.sort(key=lambda x: (x['date'], x['flight_number']))
+        segment_list.sort(key=itemgetter('date', 'flight_number'))
 
         return segment_list
 
@@ -561,11 +754,25 @@ class OPRConnection:
         # Get items from this specific segment
         stac_items = self.query_frames(collections=[collection], segment_paths=[segment_path], properties=properties)
 
+        # Without a frame number, the dataset may cover only part of the
+        # segment; skip layer files of frames entirely outside its time range
+        # rather than downloading them only to trim them away below
+        start_time, end_time = None, None
+        if frame is None and isinstance(segment, xr.Dataset):
+            start_time, end_time = self._time_bounds(segment)
+
         # Filter for items that have CSARP_layer assets
         layer_items = []
         for idx, item in stac_items.iterrows():
-            if 'CSARP_layer' in item['assets']:
-                layer_items.append(item)
+            if 'CSARP_layer' not in item['assets']:
+                continue
+            properties = item['properties']
+            if start_time is not None and 'start_datetime' in properties and 'end_datetime' in properties:
+                item_start = pd.to_datetime(properties['start_datetime'], utc=True).tz_localize(None)
+                item_end = pd.to_datetime(properties['end_datetime'], utc=True).tz_localize(None)
+                if item_end < start_time or item_start > end_time:
+                    continue
+            layer_items.append(item)
         
         if not layer_items:
             if raise_errors:
@@ -573,18 +780,20 @@ class OPRConnection:
             else:
                 return {}
         
-        # Load each layer file and combine them
+        # Load the layer files concurrently (each is a separate download) and
+        # combine them
+        urls = [item['assets']['CSARP_layer']['href'] for item in layer_items
+                if item['assets']['CSARP_layer'] and 'href' in item['assets']['CSARP_layer']]
         layer_frames = []
-        for item in layer_items:
-            layer_asset = item['assets']['CSARP_layer']
-            if layer_asset and 'href' in layer_asset:
-                url = layer_asset['href']
-                try:
-                    layer_ds = self.load_layers_file(url)
-                    layer_frames.append(layer_ds)
-                except Exception as e:
-                    print(f"Warning: Failed to load layer file {url}: {e}")
-                    continue
+        if urls:
+            with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+                futures = [executor.submit(self.load_layers_file, url) for url in urls]
+                for url, future in zip(urls, futures):
+                    try:
+                        layer_frames.append(future.result())
+                    except Exception as e:
+                        warnings.warn(f"Failed to load layer file {url}: {e}", UserWarning)
+                        continue
         
         if not layer_frames:
             if raise_errors:
@@ -625,18 +834,23 @@ class OPRConnection:
         
         return layers
 
-    def _trim_to_bounds(self, ds: xr.Dataset, ref: Union[xr.Dataset, dict]) -> xr.Dataset:
-        start_time, end_time = None, None
+    def _time_bounds(self, ref: Union[xr.Dataset, dict]) -> tuple:
+        """Return the (start, end) time of a dataset or STAC item, or (None, None)."""
         if isinstance(ref, xr.Dataset) and 'slow_time' in ref.coords:
-            start_time = ref['slow_time'].min()
-            end_time = ref['slow_time'].max()
-        else:
-            properties = ref.get('properties', {})
-            if 'start_datetime' in properties and 'end_datetime' in properties:
-                start_time = pd.to_datetime(properties['start_datetime'])
-                end_time = pd.to_datetime(properties['end_datetime'])
+            return ref['slow_time'].min().values, ref['slow_time'].max().values
+        properties = ref.get('properties', {})
+        if 'start_datetime' in properties and 'end_datetime' in properties:
+            return pd.to_datetime(properties['start_datetime']), pd.to_datetime(properties['end_datetime'])
+        return None, None
+
+    def _trim_to_bounds(self, ds: xr.Dataset, ref: Union[xr.Dataset, dict] = None, bounds: tuple = None) -> xr.Dataset:
+        """
+        Select the part of ds within the time range of ref. Precomputed
+        bounds from _time_bounds may be passed instead of ref.
+        """
+        start_time, end_time = bounds if bounds is not None else self._time_bounds(ref)
 
-        if start_time:
+        if start_time is not None:
             return ds.sel(slow_time=slice(start_time, end_time))
         else:
             return ds
@@ -679,7 +893,7 @@ class OPRConnection:
         # Apply common manipulations to match the expected structure
         # Convert GPS time to datetime coordinate
         if 'gps_time' in ds.variables:
-            slow_time_dt = pd.to_datetime(ds['gps_time'].values, unit='s')
+            slow_time_dt = seconds_to_datetime64(ds['gps_time'].values)
             ds = ds.assign_coords(slow_time=('slow_time', slow_time_dt))
             
             # Set slow_time as the main coordinate and remove gps_time from data_vars
@@ -821,6 +1035,43 @@ class OPRConnection:
         
         return ds
 
+    def _get_layer_points(self, segment_path: str, collection: str, location: str, include_geometry: bool) -> dict:
+        """
+        Fetch the OPS layer points of a segment. If a cache directory is set,
+        successful responses are stored there as JSON (when possible) and
+        reused afterwards.
+        """
+        cache_path = None
+        if self.cache_dir:
+            params = {'collection': collection, 'segment_path': segment_path,
+                      'location': location, 'include_geometry': include_geometry}
+            key = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:32]
+            cache_path = os.path.join(self.cache_dir, "layers", f"{key}.json")
+            try:
+                with open(cache_path) as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError):
+                pass
+
+        layer_points = ops_api.get_layer_points(
+            segment_name=segment_path,
+            season_name=collection,
+            location=location,
+            include_geometry=include_geometry
+        )
+
+        if cache_path and layer_points and layer_points.get('status') == 1:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                tmp_path = f"{cache_path}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump(layer_points, f)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # The on-disk cache is best effort
+
+        return layer_points
+
     def get_layers_db(self, flight: Union[xr.Dataset, dict], include_geometry=True, raise_errors=True) -> dict:
         """
         Fetch layer data from the OPS API
@@ -853,12 +1104,7 @@ class OPRConnection:
         else:
             raise ValueError("Dataset does not belong to a recognized location (Antarctica or Greenland).")
         
-        layer_points = ops_api.get_layer_points(
-            segment_name=segment_path,
-            season_name=collection,
-            location=location,
-            include_geometry=include_geometry
-        )
+        layer_points = self._get_layer_points(segment_path, collection, location, include_geometry)
 
         if layer_points['status'] != 1:
             if raise_errors:
@@ -866,27 +1112,39 @@ class OPRConnection:
             else:
                 return {}
 
+        data = layer_points['data']
+        if not data.get('gps_time'):
+            return {}  # The segment has no layer points
+
+        # Convert GPS time to a datetime slow_time coordinate once, while
+        # building the dataset, before splitting into layers
         layer_ds_raw = xr.Dataset(
-            {k: (['gps_time'], v) for k, v in layer_points['data'].items() if k != 'gps_time'},
-            coords={'gps_time': layer_points['data']['gps_time']}
+            {k: (['slow_time'], v) for k, v in data.items() if k != 'gps_time'},
+            coords={'slow_time': seconds_to_datetime64(data['gps_time'])}
         )
+
         # Split into a dictionary of layers based on lyr_id
-        layer_ids = set(layer_ds_raw['lyr_id'].to_numpy())
-        layer_ids = [int(layer_id) for layer_id in layer_ids if not np.isnan(layer_id)]
+        lyr_id = layer_ds_raw['lyr_id'].to_numpy()
+        layer_ids = np.unique(lyr_id[~np.isnan(lyr_id)]).astype(np.int64).tolist()
 
-        layers = {}
-        for layer_id in layer_ids:
-            l = layer_ds_raw.where(layer_ds_raw['lyr_id'] == layer_id, drop=True)
+        # Group the points by layer with one stable sort, rather than
+        # scanning every point once per layer
+        order = np.argsort(lyr_id, kind='stable')
+        sorted_lyr_id = lyr_id[order]
 
-            l = l.sortby('gps_time')
+        # The flight's time range is the same for every layer
+        bounds = self._time_bounds(flight)
 
-            l = l.rename({'gps_time': 'slow_time'})
-            l = l.set_coords(['slow_time'])
+        layers = {}
+        for layer_id in layer_ids:
+            start = np.searchsorted(sorted_lyr_id, layer_id, side='left')
+            stop = np.searchsorted(sorted_lyr_id, layer_id, side='right')
+            l = layer_ds_raw.isel(slow_time=order[start:stop])
 
-            l['slow_time'] = pd.to_datetime(l['slow_time'].values, unit='s')
+            l = l.sortby('slow_time')
 
             # Filter to the same time range as flight
-            l = self._trim_to_bounds(l, flight)
+            l = self._trim_to_bounds(l, bounds=bounds)
 
             layers[layer_id] = l
 
@@ -1,11 +1,17 @@
+import numpy as np
+import pandas as pd
 import xarray as xr
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, Union
 import warnings
 import geopandas as gpd
 
 from xopr.util import get_ror_display_name, merge_dicts_no_conflicts
 
+# Shared pool for concurrent ROR lookups; threads are only started on first use
+_ror_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="xopr-ror")
+
 def merge_frames(frames: Iterable[xr.Dataset]) -> Union[list[xr.Dataset], xr.Dataset]:
     """
     Merge a set of radar frames into a list of merged xarray Datasets. Frames from the
@@ -47,7 +53,7 @@ def merge_frames(frames: Iterable[xr.Dataset]) -> Union[list[xr.Dataset], xr.Dat
 
         for k in mergable_keys:
             if k not in merged_segment.attrs:
-                merged_segment.attrs[k] = set([v for v in {f.attrs.get(k) for f in segment_frames} if v is not None])
+                merged_segment.attrs[k] = {v for f in segment_frames if (v := f.attrs.get(k)) is not None}
 
         merged_segments.append(merged_segment)
 
@@ -56,7 +62,37 @@ def merge_frames(frames: Iterable[xr.Dataset]) -> Union[list[xr.Dataset], xr.Dat
     else:
         return merged_segments
 
-def generate_citation(ds : xr.Dataset) -> str:
+def merge_layers(layers: dict) -> xr.Dataset:
+    """
+    Combine a dictionary of layers, as returned by OPRConnection.get_layers, into
+    a single Dataset with a 'lyr_id' dimension, so that per-layer operations can
+    be done in one vectorized step instead of a loop over layers.
+
+    Parameters
+    ----------
+    layers : dict
+        Dictionary mapping layer IDs to layer Datasets indexed by 'slow_time'.
+        Layers from either the OPS database or CSARP_layer files are accepted.
+
+    Returns
+    -------
+    xr.Dataset
+        Dataset with dimensions ('lyr_id', 'slow_time'). Layers are aligned on
+        the sorted union of their slow_time values and padded with NaN where a
+        layer has no pick. If a layer has several picks at the same slow_time
+        (as OPS point responses can), only the first is kept.
+    """
+    if not layers:
+        return xr.Dataset()
+
+    # The per-point layer ID becomes the new dimension's coordinate. Alignment
+    # needs a unique slow_time index within each layer.
+    datasets = [l.drop_vars('lyr_id', errors='ignore').drop_duplicates('slow_time').sortby('slow_time')
+                for l in layers.values()]
+    return xr.concat(datasets, dim=pd.Index(list(layers.keys()), name='lyr_id'),
+                     join='outer', combine_attrs=merge_dicts_no_conflicts)
+
+def generate_citation(ds : xr.Dataset, cache_dir: str = None) -> str:
         """
         Generate a citation string for the dataset based on its attributes.
 
@@ -64,6 +100,8 @@ def generate_citation(ds : xr.Dataset) -> str:
         ----------
         ds : xr.Dataset
             The xarray Dataset containing metadata.
+        cache_dir : str, optional
+            Directory in which to cache institution (ROR) lookups across sessions.
 
         Returns
         -------
@@ -79,9 +117,16 @@ def generate_citation(ds : xr.Dataset) -> str:
         if 'ror' in ds.attrs and ds.attrs['ror']:
             any_citation_info = True
             if isinstance(ds.attrs['ror'], (set, list)):
-                institution_name = ', '.join([get_ror_display_name(ror) for ror in ds.attrs['ror']])
+                # Look up all institutions concurrently; each is a network request
+                rors = list(ds.attrs['ror'])
+                if len(rors) > 1:
+                    names = _ror_executor.map(lambda ror: get_ror_display_name(ror, cache_dir), rors)
+                else:
+                    names = [get_ror_display_name(ror, cache_dir) for ror in rors]
+                # Institutions whose lookup failed are cited by their ROR ID
+                institution_name = ', '.join(name or ror for ror, name in zip(rors, names))
             else:
-                institution_name = get_ror_display_name(ds.attrs['ror'])
+                institution_name = get_ror_display_name(ds.attrs['ror'], cache_dir) or ds.attrs['ror']
 
             citation_string += f"This data was collected by {institution_name}.\n"
 
@@ -183,9 +228,6 @@ def _calculate_crossing_angle(line1, line2, intersection_point):
     float
         The crossing angle in degrees.
     """
-    from shapely.geometry import Point
-    import numpy as np
-
     def get_line_angle(line, point):
         # Get the nearest point on the line to the intersection point
         nearest_point = line.interpolate(line.project(point))
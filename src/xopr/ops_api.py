@@ -5,13 +5,24 @@ It includes functions to retrieve segment IDs, layer points, and segment metadat
 """
 
 import base64
+import copy
+import functools
+import http.cookiejar
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import urllib.parse
 import time
 
 ops_base_url = "https://ops.cresis.ku.edu/ops"
 
+# Shared session so OPS requests (including task status polling) reuse
+# HTTPS connections instead of opening a new one per request. Cookies set by
+# the server are not kept, so every request stays anonymous and independent.
+_ops_session = requests.Session()
+_ops_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+_ops_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
 
 def get_layer_points(segment_name : str, season_name : str, location=None, layer_names=None, include_geometry=True, raise_errors=True):
     """
@@ -67,10 +78,42 @@ def get_layer_points(segment_name : str, season_name : str, location=None, layer
     return _ops_api_request(f"/get/layer/points", data_payload, request_type='POST')
 
 
+class _UncachedResponse(Exception):
+    """Carries an unsuccessful OPS response out of a cached helper, so it is not cached."""
+
+    def __init__(self, response):
+        super().__init__(response)
+        self.response = response
+
+
+@functools.lru_cache(maxsize=256)
+def _fetch_segment_metadata(segment_name: str, season_name: str) -> dict:
+    """
+    Request segment metadata from the OPS API, memoizing successful responses.
+
+    Failed requests and responses with a status other than 1 raise and are
+    not cached, so they are retried on the next call.
+    """
+    data_payload = {
+        "properties": {
+            "segment": segment_name,
+            "season": season_name
+        }
+    }
+
+    response = _ops_api_request(f"/get/segment/metadata", data_payload)
+    if not response or response.get('status') != 1:
+        raise _UncachedResponse(response)
+    return response
+
+
 def get_segment_metadata(segment_name : str, season_name : str):
     """
     Get segment metadata from the OPS API.
 
+    Successful responses are cached per segment, since every frame of a
+    segment asks for the same metadata. Each call returns its own copy.
+
     Parameters
     ----------
     segment_name : str, optional
@@ -88,15 +131,10 @@ def get_segment_metadata(segment_name : str, season_name : str):
     ValueError
         If neither segment_id nor both segment_name and season_name are provided.
     """
-
-    data_payload = {
-        "properties": {
-            "segment": segment_name,
-            "season": season_name
-        }
-    }
-
-    return _ops_api_request(f"/get/segment/metadata", data_payload)
+    try:
+        return copy.deepcopy(_fetch_segment_metadata(segment_name, season_name))
+    except _UncachedResponse as e:
+        return e.response
 
 
 def _ops_api_request(path, data, request_type='POST', headers=None, base_url=ops_base_url, retries=3, job_timeout=200, debug=False, initial_retry_time=1):
@@ -143,11 +181,11 @@ def _ops_api_request(path, data, request_type='POST', headers=None, base_url=ops
         if request_type == 'POST':
             if debug:
                 print(f"Making POST request to {url} with data: {form_data}")
-            response = requests.post(url, data=form_data, headers=headers)
+            response = _ops_session.post(url, data=form_data, headers=headers)
         elif request_type == 'GET':
             if debug:
                 print(f"Making GET request to {url}")
-            response = requests.get(url, headers=headers)
+            response = _ops_session.get(url, headers=headers)
 
         # Check if request was successful
         response.raise_for_status()
@@ -117,8 +117,6 @@ def interpolate_to_vertical_grid(ds: xr.Dataset,
     xr.Dataset
         Dataset with data interpolated to regular vertical distance grid
     """
-    from scipy.interpolate import griddata
-    
     # Calculate vertical distances
     vert_dist = estimate_vertical_distances(ds, epsilon_ice)
 
@@ -141,8 +139,6 @@ def interpolate_to_vertical_grid(ds: xr.Dataset,
     regular_vert = np.arange(vert_min, vert_max, vert_spacing)
     
     # Use 1D interpolation along each trace (much faster than 2D griddata)
-    from scipy.interpolate import interp1d
-    
     n_traces = len(ds['slow_time'])
     n_vert = len(regular_vert)
     data_regular = np.full((n_traces, n_vert), np.nan, dtype=np.float32)
@@ -20,6 +20,7 @@ from .geometry import (
 from .metadata import extract_item_metadata, discover_campaigns, discover_flight_lines, collect_uniform_metadata
 from .build import (
     process_single_flight, process_single_campaign,
+    process_flights, assemble_campaign_collection,
     collect_metadata_from_items,
     build_catalog_from_parquet_metadata
 )
@@ -45,6 +46,8 @@ __all__ = [
     # Build functions
     "process_single_flight",
     "process_single_campaign",
+    "process_flights",
+    "assemble_campaign_collection",
     "collect_metadata_from_items",
     "export_collection_to_parquet",
     "build_catalog_from_parquet_metadata"
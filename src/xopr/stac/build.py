@@ -6,7 +6,11 @@ including processing campaigns, flights, and items. These functions are designed
 to be testable and reusable, supporting both sequential and parallel execution.
 """
 
+import hashlib
 import json
+import logging
+import os
+import pickle
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
@@ -14,18 +18,153 @@ import numpy as np
 import pyarrow.parquet as pq
 import pystac
 import stac_geoparquet
+from dask.distributed import Client, as_completed
 
 from .catalog import (
     create_catalog, create_collection,
     build_collection_extent, create_items_from_flight_data,
     export_collection_to_parquet
 )
-from omegaconf import DictConfig
+from omegaconf import DictConfig, OmegaConf
 from .metadata import discover_campaigns, discover_flight_lines
 
 # STAC extension URLs
 SCI_EXT = 'https://stac-extensions.github.io/scientific/v1.0.0/schema.json'
 
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Campaign Cache
+# ============================================================================
+
+def campaign_cache_key(campaign_path: Path, conf: DictConfig) -> str:
+    """
+    Compute a content key for a campaign directory and its build settings.
+
+    The key changes whenever the campaign directory, any data product
+    directory, any top-level flight directory, or the size or modification
+    time of any file in a flight directory changes, or when any
+    configuration value that affects the generated items changes. File
+    stamps are needed because rewriting a file in place does not update
+    the modification time of its directory.
+
+    Parameters
+    ----------
+    campaign_path : Path
+        Path to campaign directory
+    conf : DictConfig
+        Configuration object with data, assets, processing, and geometry settings
+
+    Returns
+    -------
+    str
+        Hex-encoded SHA-256 digest identifying this campaign build
+    """
+    campaign_path = Path(campaign_path)
+    products = [conf.data.primary_product] + list(conf.data.get('extra_products', []) or [])
+
+    stamps = [f"{campaign_path}:{campaign_path.stat().st_mtime_ns}"]
+    for product in products:
+        product_path = campaign_path / product
+        if not product_path.is_dir():
+            continue
+        stamps.append(f"{product}:{product_path.stat().st_mtime_ns}")
+        for flight_dir in sorted(product_path.iterdir()):
+            if flight_dir.is_dir():
+                stamps.append(f"{product}/{flight_dir.name}:{flight_dir.stat().st_mtime_ns}")
+                with os.scandir(flight_dir) as entries:
+                    files = sorted((entry.name, entry.stat()) for entry in entries if entry.is_file())
+                stamps.extend(
+                    f"{product}/{flight_dir.name}/{name}:{stat.st_size}:{stat.st_mtime_ns}"
+                    for name, stat in files
+                )
+
+    for field in ["assets.base_url", "processing.max_items", "geometry.tolerance", "output.license"]:
+        stamps.append(f"{field}={OmegaConf.select(conf, field)}")
+
+    return hashlib.sha256("\n".join(stamps).encode()).hexdigest()
+
+
+def _cache_file(cache_key: str, cache_dir: Path, kind: str) -> Path:
+    """Path of a cache entry; each kind of result has its own file name prefix."""
+    return Path(cache_dir) / f"{kind}-{cache_key}.pkl"
+
+
+def load_cached_campaign(cache_key: str, cache_dir: Path, kind: str,
+                         expected_type: Optional[type] = None) -> Optional[Any]:
+    """
+    Load a previously cached campaign build result.
+
+    Parameters
+    ----------
+    cache_key : str
+        Key from campaign_cache_key()
+    cache_dir : Path
+        Directory holding cached campaign builds
+    kind : str
+        Kind of cached result (e.g. 'items' or 'collection'). Results of
+        different kinds for the same campaign are stored separately.
+    expected_type : type, optional
+        If given, a cached object of any other type is treated as a miss
+
+    Returns
+    -------
+    Any or None
+        The cached object, or None if there is no usable cache entry
+    """
+    cache_file = _cache_file(cache_key, cache_dir, kind)
+    if not cache_file.exists():
+        return None
+
+    try:
+        with open(cache_file, 'rb') as f:
+            result = pickle.load(f)
+    except Exception as e:
+        logger.warning("Ignoring unreadable cache entry %s: %s", cache_file.name, e)
+        return None
+
+    if expected_type is not None and not isinstance(result, expected_type):
+        logger.warning("Ignoring cache entry %s holding a %s instead of a %s",
+                       cache_file.name, type(result).__name__, expected_type.__name__)
+        return None
+
+    return result
+
+
+def save_cached_campaign(result: Any, cache_key: str, cache_dir: Path, kind: str) -> Path:
+    """
+    Store a campaign build result in the cache.
+
+    The entry is written to a temporary file first and then renamed so that
+    an interrupted run never leaves a truncated cache entry behind.
+
+    Parameters
+    ----------
+    result : Any
+        Picklable campaign build result (e.g. a pystac.Collection or list of items)
+    cache_key : str
+        Key from campaign_cache_key()
+    cache_dir : Path
+        Directory holding cached campaign builds
+    kind : str
+        Kind of cached result, as passed to load_cached_campaign()
+
+    Returns
+    -------
+    Path
+        Path to the written cache file
+    """
+    cache_file = _cache_file(cache_key, cache_dir, kind)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix('.pkl.tmp')
+
+    with open(tmp_file, 'wb') as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_file.replace(cache_file)
+
+    return cache_file
+
 
 # ============================================================================
 # Core Processing Functions
@@ -116,8 +255,7 @@ def process_single_flight(
         )
         
         # Add extra fields
-        for key, value in flight_extra_fields.items():
-            flight_collection.extra_fields[key] = value
+        flight_collection.extra_fields.update(flight_extra_fields)
         
         # Add items to collection
         flight_collection.add_items(items)
@@ -130,14 +268,136 @@ def process_single_flight(
         
     except Exception as e:
         flight_id = flight_data.get('flight_id', 'unknown')
-        if conf.logging.get('verbose', False):
-            print(f"Warning: Failed to process flight {flight_id}: {e}")
+        logger.warning("Failed to process flight %s: %s", flight_id, e)
         return None
 
 
-def process_single_campaign(
+def process_flights(
+    flight_lines: List[Dict[str, Any]],
+    campaign: Dict[str, Any],
+    conf: DictConfig,
+    client: Optional[Client] = None
+) -> List[Dict[str, Any]]:
+    """
+    Process the flights of a campaign, optionally as one Dask task per flight.
+    
+    Parameters
+    ----------
+    flight_lines : list of dict
+        Flight metadata from discover_flight_lines()
+    campaign : dict
+        Campaign metadata with keys 'name', 'year', 'location', 'aircraft'
+    conf : DictConfig
+        Configuration object passed through to process_single_flight()
+    client : dask.distributed.Client, optional
+        If provided, each flight is submitted as a separate task so that large
+        campaigns are spread across all workers. If None, flights are
+        processed sequentially in the current process.
+        
+    Returns
+    -------
+    list of dict
+        Successful results from process_single_flight(), in the same order
+        as flight_lines
+    """
+    campaign_name = campaign['name']
+    
+    if client is None or len(flight_lines) < 2:
+        results = [
+            process_single_flight(flight_data, campaign_name, campaign, conf)
+            for flight_data in flight_lines
+        ]
+    else:
+        # Results depend on the files on disk, not just the arguments, so
+        # every call gets fresh task keys instead of reusing earlier results
+        futures = client.map(
+            process_single_flight,
+            flight_lines,
+            campaign_name=campaign_name,
+            campaign_info=campaign,
+            conf=conf,
+            pure=False
+        )
+        future_to_index = {future: i for i, future in enumerate(futures)}
+        
+        results = [None] * len(futures)
+        for future in as_completed(futures):
+            results[future_to_index[future]] = future.result()
+    
+    flight_results = []
+    for flight_result in results:
+        if flight_result:
+            flight_results.append(flight_result)
+            logger.debug(
+                "Added flight %s with %d items",
+                flight_result['flight_id'], len(flight_result['items'])
+            )
+    
+    return flight_results
+
+
+def assemble_campaign_collection(
+    flight_results: List[Dict[str, Any]],
     campaign: Dict[str, Any],
     conf: DictConfig
+) -> pystac.Collection:
+    """
+    Build a campaign collection from processed flight results.
+    
+    Parameters
+    ----------
+    flight_results : list of dict
+        Non-empty list of results from process_single_flight()
+    campaign : dict
+        Campaign metadata with keys 'name', 'year', 'location', 'aircraft'
+    conf : DictConfig
+        Configuration object with output.license setting
+        
+    Returns
+    -------
+    pystac.Collection
+        Campaign collection with one child collection per flight
+    """
+    flight_collections = [result['collection'] for result in flight_results]
+    all_campaign_items = [item for result in flight_results for item in result['items']]
+    
+    # Create campaign collection
+    campaign_extent = build_collection_extent(all_campaign_items)
+
+    # Collect metadata for extensions
+    campaign_extensions, campaign_extra_fields = collect_metadata_from_items(all_campaign_items)
+    
+    # Create campaign collection (no geometry per user request - only item-level geometries)
+    campaign_collection = create_collection(
+        collection_id=campaign['name'],
+        description=(
+            f"{campaign['year']} {campaign['aircraft']} flights "
+            f"over {campaign['location']}"
+        ),
+        extent=campaign_extent,
+        license=conf.output.get('license', 'various'),
+        stac_extensions=campaign_extensions if campaign_extensions else None
+        # geometry parameter removed - collection-level geometry not included in parquet
+    )
+    
+    # Add extra fields
+    campaign_collection.extra_fields.update(campaign_extra_fields)
+    
+    # Add flight collections as children
+    campaign_collection.add_children(flight_collections)
+    
+    logger.info(
+        "Completed campaign %s with %d flight collections and %d total items",
+        campaign['name'], len(flight_collections), len(all_campaign_items)
+    )
+    
+    return campaign_collection
+
+
+def process_single_campaign(
+    campaign: Dict[str, Any],
+    conf: DictConfig,
+    client: Optional[Client] = None
 ) -> Optional[pystac.Collection]:
     """
     Process a single campaign and return campaign collection.
@@ -148,6 +408,9 @@ def process_single_campaign(
         Campaign metadata with keys 'name', 'path', 'year', 'location', 'aircraft'
     conf : DictConfig
         Configuration object with data, processing, and logging settings
+    client : dask.distributed.Client, optional
+        If provided, flights are processed as individual Dask tasks and the
+        campaign collection is assembled locally once they complete.
         
     Returns
     -------
@@ -176,22 +439,28 @@ def process_single_campaign(
     """
     campaign_path = Path(campaign['path'])
     campaign_name = campaign['name']
-    verbose = conf.logging.get('verbose', False)
     
-    if verbose:
-        print(f"Processing campaign: {campaign_name}")
+    logger.info("Processing campaign: %s", campaign_name)
+    
+    # Reuse a previous build if nothing relevant has changed on disk
+    cache_dir = OmegaConf.select(conf, 'processing.cache_dir')
+    cache_key = None
+    if cache_dir and campaign_path.exists():
+        cache_key = campaign_cache_key(campaign_path, conf)
+        cached = load_cached_campaign(cache_key, cache_dir, 'collection', pystac.Collection)
+        if cached is not None:
+            logger.info("Using cached build for %s", campaign_name)
+            return cached
     
     # Discover flight lines
     try:
         flight_lines = discover_flight_lines(campaign_path, conf)
     except FileNotFoundError as e:
-        if verbose:
-            print(f"Warning: Skipping {campaign_name}: {e}")
+        logger.warning("Skipping %s: %s", campaign_name, e)
         return None
     
     if not flight_lines:
-        if verbose:
-            print(f"Warning: No flight lines found for {campaign_name}")
+        logger.warning("No flight lines found for %s", campaign_name)
         return None
     
     # Limit flights if specified
@@ -200,59 +469,16 @@ def process_single_campaign(
         flight_lines = flight_lines[:max_items]
     
     # Process flights
-    flight_collections = []
-    all_campaign_items = []
-
-    for flight_data in flight_lines:
-        flight_result = process_single_flight(
-            flight_data, campaign_name, campaign, conf
-        )
-
-        if flight_result:
-            flight_collections.append(flight_result['collection'])
-            all_campaign_items.extend(flight_result['items'])
-            
-            if verbose:
-                print(f"  Added flight {flight_result['flight_id']} with {len(flight_result['items'])} items")
+    flight_results = process_flights(flight_lines, campaign, conf, client)
     
-    if not flight_collections:
-        if verbose:
-            print(f"Warning: No valid flights processed for {campaign_name}")
+    if not flight_results:
+        logger.warning("No valid flights processed for %s", campaign_name)
         return None
     
-    # Create campaign collection
-    campaign_extent = build_collection_extent(all_campaign_items)
-
-    # Collect metadata for extensions
-    campaign_extensions, campaign_extra_fields = collect_metadata_from_items(all_campaign_items)
+    campaign_collection = assemble_campaign_collection(flight_results, campaign, conf)
     
-    # Create campaign collection (no geometry per user request - only item-level geometries)
-    campaign_collection = create_collection(
-        collection_id=campaign_name,
-        description=(
-            f"{campaign['year']} {campaign['aircraft']} flights "
-            f"over {campaign['location']}"
-        ),
-        extent=campaign_extent,
-        license=conf.output.get('license', 'various'),
-        stac_extensions=campaign_extensions if campaign_extensions else None
-        # geometry parameter removed - collection-level geometry not included in parquet
-    )
-    
-    # Add extra fields
-    for key, value in campaign_extra_fields.items():
-        campaign_collection.extra_fields[key] = value
-    
-    # Add flight collections as children
-    for flight_collection in flight_collections:
-        campaign_collection.add_child(flight_collection)
-    
-    if verbose:
-        print(
-            f"Completed campaign {campaign_name} with "
-            f"{len(flight_collections)} flight collections and "
-            f"{len(all_campaign_items)} total items"
-        )
+    if cache_key is not None:
+        save_cached_campaign(campaign_collection, cache_key, cache_dir, 'collection')
     
     return campaign_collection
 
@@ -283,16 +509,27 @@ def collect_metadata_from_items(items: List[pystac.Item]) -> tuple:
     extensions = []
     extra_fields = {}
     
-    # Scientific metadata
-    dois = [
-        item.properties.get('sci:doi') for item in items
-        if item.properties.get('sci:doi') is not None
-    ]
-    citations = [
-        item.properties.get('sci:citation') for item in items
-        if item.properties.get('sci:citation') is not None
-    ]
+    # Extract all properties of interest in a single pass over the items
+    dois = []
+    citations = []
+    center_frequencies = []
+    bandwidths = []
+    for item in items:
+        get = item.properties.get
+        doi = get('sci:doi')
+        if doi is not None:
+            dois.append(doi)
+        citation = get('sci:citation')
+        if citation is not None:
+            citations.append(citation)
+        frequency = get('opr:frequency')
+        if frequency is not None:
+            center_frequencies.append(frequency)
+        bandwidth = get('opr:bandwidth')
+        if bandwidth is not None:
+            bandwidths.append(bandwidth)
     
+    # Scientific metadata
     if dois and len(np.unique(dois)) == 1:
         extensions.append(SCI_EXT)
         extra_fields['sci:doi'] = dois[0]
@@ -303,15 +540,6 @@ def collect_metadata_from_items(items: List[pystac.Item]) -> tuple:
         extra_fields['sci:citation'] = citations[0]
     
     # OPR radar metadata (formerly SAR extension)
-    center_frequencies = [
-        item.properties.get('opr:frequency') for item in items
-        if item.properties.get('opr:frequency') is not None
-    ]
-    bandwidths = [
-        item.properties.get('opr:bandwidth') for item in items
-        if item.properties.get('opr:bandwidth') is not None
-    ]
-
     if center_frequencies and len(np.unique(center_frequencies)) == 1:
         extra_fields['opr:frequency'] = center_frequencies[0]
 
@@ -431,7 +431,8 @@ def export_collection_to_parquet(
     collection: pystac.Collection,
     config: DictConfig,
     provider: str = None,
-    hemisphere: str = None
+    hemisphere: str = None,
+    items: Optional[List[pystac.Item]] = None
 ) -> Optional[Path]:
     """
     Export a single STAC collection to a parquet file with collection metadata.
@@ -450,6 +451,11 @@ def export_collection_to_parquet(
         Data provider from config (awi, cresis, dtu, utig)
     hemisphere : str, optional
         Hemisphere ('north' or 'south'). If not provided, will attempt to detect.
+    items : list of pystac.Item, optional
+        Items belonging to the collection. If the caller already holds the
+        flat item list, passing it here skips walking the collection's link
+        tree. If None, items are gathered from the collection and its
+        child collections.
 
     Returns
     -------
@@ -467,11 +473,14 @@ def export_collection_to_parquet(
     output_dir = Path(config.output.path)
     verbose = config.logging.get('verbose', False)
     
-    # Get items from collection and subcollections
-    collection_items = list(collection.get_items())
-    if not collection_items:
-        for child_collection in collection.get_collections():
-            collection_items.extend(list(child_collection.get_items()))
+    # Get items from collection and subcollections unless already provided
+    if items is not None:
+        collection_items = list(items)
+    else:
+        collection_items = list(collection.get_items())
+        if not collection_items:
+            for child_collection in collection.get_collections():
+                collection_items.extend(list(child_collection.get_items()))
 
     if not collection_items:
         if verbose:
@@ -619,6 +628,10 @@ def build_catalog_from_parquet_files(
     if verbose:
         print(f"Building catalog from {len(parquet_paths)} parquet files")
     
+    # Tally structure while building so the summary doesn't re-walk the catalog
+    n_collections = 0
+    n_items = 0
+    
     for parquet_path in parquet_paths:
         try:
             # Get collection metadata from parquet file metadata (without reading the data)
@@ -650,15 +663,19 @@ def build_catalog_from_parquet_files(
                     f"field of the file metadata."
                 )
             
-            # Reconstruct collection from metadata (without items - they stay in parquet)
-            collection = pystac.Collection.from_dict(collection_dict)
+            # Reconstruct collection from metadata (without items - they stay in parquet).
+            # The dict was freshly parsed above, so pystac can consume it without a deep copy.
+            collection = pystac.Collection.from_dict(collection_dict, preserve_dict=False)
             
             # Add collection to catalog (items remain in parquet file)
             catalog.add_child(collection)
             
+            # Get row count from metadata without reading the table
+            num_rows = parquet_metadata.num_rows
+            n_collections += 1
+            n_items += num_rows
+            
             if verbose:
-                # Get row count from metadata without reading the table
-                num_rows = parquet_metadata.num_rows
                 print(f"  ✅ Added collection: {collection.id} from {parquet_path.name} ({num_rows} items in parquet)")
                     
         except Exception as e:
@@ -667,7 +684,6 @@ def build_catalog_from_parquet_files(
             continue
     
     if verbose:
-        collections = list(catalog.get_collections())
-        print(f"Built catalog with {len(collections)} collections")
+        print(f"Built catalog with {n_collections} collections ({n_items} items in parquet)")
     
     return catalog
@@ -192,7 +192,9 @@ def get_default_config() -> DictConfig:
         "processing": {
             "n_workers": 4,
             "memory_limit": "4GB",
+            "adaptive": False,
             "max_items": None,
+            "cache_dir": None,
         },
         "assets": {
             "base_url": "https://data.cresis.ku.edu/data/rds/",
@@ -5,8 +5,10 @@ This module has been refactored to accept DictConfig objects directly,
 removing the need for multiple parameters.
 """
 
+import os
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Union, Optional
 
@@ -21,10 +23,30 @@ from xopr.opr_access import OPRConnection
 from .geometry import simplify_geometry_polar_projection
 
 
+def _list_mat_files(directory: str) -> Optional[Dict[str, str]]:
+    """
+    List ``*.mat`` entries in a directory, or None if it does not exist.
+
+    Selects the same entries as ``Path(directory).glob("*.mat")``,
+    including hidden files.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {
+                entry.name: entry.path for entry in entries
+                if entry.name.endswith('.mat')
+            }
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 def discover_flight_lines(campaign_path: Union[str, Path], conf: DictConfig) -> List[Dict[str, Any]]:
     """
     Discover flight lines for a campaign using configuration.
     
+    Directory listings for all flights and data products are fetched
+    concurrently, which hides per-directory latency on network filesystems.
+    
     Parameters
     ----------
     campaign_path : Union[str, Path]
@@ -49,42 +71,54 @@ def discover_flight_lines(campaign_path: Union[str, Path], conf: DictConfig) ->
         raise FileNotFoundError(f"Data product directory not found: {product_path}")
     
     flight_pattern = re.compile(r'^(\d{8}_\d+)$')
+    
+    with os.scandir(product_path) as entries:
+        flight_names = sorted(
+            entry.name for entry in entries
+            if entry.is_dir() and flight_pattern.match(entry.name)
+        )
+    
+    if not flight_names:
+        return []
+    
+    # Preload every (product, flight) directory listing in parallel
+    products = [primary_product] + list(extra_products)
+    listing_dirs = [
+        str(campaign_path / product / flight_name)
+        for flight_name in flight_names
+        for product in products
+    ]
+    with ThreadPoolExecutor(max_workers=min(32, len(listing_dirs))) as executor:
+        listings = dict(zip(listing_dirs, executor.map(_list_mat_files, listing_dirs)))
+    
     flights = []
     
-    for flight_dir in product_path.iterdir():
-        if flight_dir.is_dir():
-            match = flight_pattern.match(flight_dir.name)
-            if match:
-                flight_id = match.group(1)
-                parts = flight_id.split('_')
-                date_part = parts[0]
-                flight_num = parts[1]
-                
-                # Collect data files for primary product
-                data_files = {
-                    primary_product: {
-                        f.name: str(f) for f in flight_dir.glob("*.mat")
-                        if "_img" not in f.name
-                    }
-                }
-                
-                # Include extra data products if they exist
-                for extra_product in extra_products:
-                    extra_product_path = campaign_path / extra_product / flight_dir.name
-                    if extra_product_path.exists():
-                        data_files[extra_product] = {
-                            f.name: str(f) for f in extra_product_path.glob("*.mat")
-                        }
-                
-                if data_files:
-                    flights.append({
-                        'flight_id': flight_id,
-                        'date': date_part,
-                        'flight_num': flight_num,
-                        'data_files': data_files
-                    })
-    
-    return sorted(flights, key=lambda x: x['flight_id'])
+    for flight_name in flight_names:
+        date_part, flight_num = flight_name.split('_')
+        
+        # Collect data files for primary product
+        primary_files = listings[str(product_path / flight_name)] or {}
+        data_files = {
+            primary_product: {
+                name: path for name, path in primary_files.items()
+                if "_img" not in name
+            }
+        }
+        
+        # Include extra data products if they exist
+        for extra_product in extra_products:
+            extra_files = listings[str(campaign_path / extra_product / flight_name)]
+            if extra_files is not None:
+                data_files[extra_product] = extra_files
+        
+        flights.append({
+            'flight_id': flight_name,
+            'date': date_part,
+            'flight_num': flight_num,
+            'data_files': data_files
+        })
+    
+    return flights
 
 
 def extract_item_metadata(
@@ -335,12 +369,16 @@ def collect_uniform_metadata(items: List, property_keys: List[str]) -> tuple[Lis
         'sar:bandwidth': SAR_EXT
     }
     
-    for key in property_keys:
-        values = [
-            item.properties.get(key)
-            for item in items
-            if item.properties.get(key) is not None
-        ]
+    # Extract all requested properties in a single pass over the items
+    values_by_key = {key: [] for key in property_keys}
+    for item in items:
+        get = item.properties.get
+        for key, values in values_by_key.items():
+            value = get(key)
+            if value is not None:
+                values.append(value)
+    
+    for key, values in values_by_key.items():
         
         if values and len(np.unique(values)) == 1:
             ext = property_mappings.get(key)
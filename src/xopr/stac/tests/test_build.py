@@ -0,0 +1,158 @@
+"""Tests for STAC catalog building functions."""
+
+import os
+from unittest.mock import patch
+
+from dask.distributed import Client
+
+from xopr.stac.build import (
+    campaign_cache_key, load_cached_campaign, save_cached_campaign,
+    process_flights, assemble_campaign_collection
+)
+from .common import (create_mock_campaign_data, create_mock_flight_data,
+                     create_mock_metadata, get_test_config)
+
+
+def _make_campaign(tmp_path):
+    """Create a minimal campaign directory tree with one flight."""
+    campaign_path = tmp_path / "2016_Antarctica_DC8"
+    flight_dir = campaign_path / "CSARP_standard" / "20161014_03"
+    flight_dir.mkdir(parents=True)
+    (flight_dir / "Data_20161014_03_001.mat").touch()
+    return campaign_path
+
+
+class TestCampaignCache:
+    """Test content-keyed caching of campaign builds."""
+
+    def test_cache_key_is_stable(self, tmp_path):
+        """Test that an unchanged campaign produces the same key."""
+        campaign_path = _make_campaign(tmp_path)
+        conf = get_test_config()
+
+        assert campaign_cache_key(campaign_path, conf) == campaign_cache_key(campaign_path, conf)
+
+    def test_cache_key_changes_with_flight_dir(self, tmp_path):
+        """Test that modifying a flight directory invalidates the key."""
+        campaign_path = _make_campaign(tmp_path)
+        conf = get_test_config()
+        key = campaign_cache_key(campaign_path, conf)
+
+        flight_dir = campaign_path / "CSARP_standard" / "20161014_03"
+        stat = flight_dir.stat()
+        os.utime(flight_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert campaign_cache_key(campaign_path, conf) != key
+
+    def test_cache_key_changes_with_config(self, tmp_path):
+        """Test that settings affecting item creation invalidate the key."""
+        campaign_path = _make_campaign(tmp_path)
+
+        key = campaign_cache_key(campaign_path, get_test_config())
+        other_key = campaign_cache_key(campaign_path, get_test_config(geometry={'tolerance': 10}))
+
+        assert key != other_key
+
+    def test_cache_key_changes_with_file_rewritten_in_place(self, tmp_path):
+        """Test that rewriting a data file invalidates the key."""
+        campaign_path = _make_campaign(tmp_path)
+        conf = get_test_config()
+        flight_dir = campaign_path / "CSARP_standard" / "20161014_03"
+        dir_stat = flight_dir.stat()
+        key = campaign_cache_key(campaign_path, conf)
+
+        (flight_dir / "Data_20161014_03_001.mat").write_bytes(b"new data")
+        os.utime(flight_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+        assert campaign_cache_key(campaign_path, conf) != key
+
+    def test_cache_round_trip(self, tmp_path):
+        """Test that saved results are loaded back unchanged."""
+        cache_dir = tmp_path / "cache"
+        result = [{'id': 'Data_20161014_03_001'}]
+
+        assert load_cached_campaign("abc", cache_dir, 'items') is None
+        save_cached_campaign(result, "abc", cache_dir, 'items')
+        assert load_cached_campaign("abc", cache_dir, 'items', list) == result
+
+    def test_cache_kinds_are_separate(self, tmp_path):
+        """Test that results of different kinds for one key do not collide."""
+        cache_dir = tmp_path / "cache"
+        save_cached_campaign([{'id': 'Data_20161014_03_001'}], "abc", cache_dir, 'items')
+
+        assert load_cached_campaign("abc", cache_dir, 'collection') is None
+
+    def test_cache_entry_of_wrong_type_is_ignored(self, tmp_path):
+        """Test that a cached object of an unexpected type is treated as a miss."""
+        cache_dir = tmp_path / "cache"
+        save_cached_campaign({'id': 'not a list'}, "abc", cache_dir, 'items')
+
+        assert load_cached_campaign("abc", cache_dir, 'items', list) is None
+
+    def test_corrupt_cache_entry_is_ignored(self, tmp_path):
+        """Test that an unreadable cache entry is treated as a miss."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "items-abc.pkl").write_bytes(b"not a pickle")
+
+        assert load_cached_campaign("abc", cache_dir, 'items') is None
+
+
+class TestProcessFlights:
+    """Test per-flight processing and campaign assembly."""
+
+    def _flight_lines(self):
+        flight_lines = []
+        for flight_id in ['20161014_03', '20161014_04', '20161015_01']:
+            flight_data = create_mock_flight_data()
+            flight_data['flight_id'] = flight_id
+            flight_lines.append(flight_data)
+        return flight_lines
+
+    def _conf(self):
+        return get_test_config(logging={'verbose': False}, output={'license': 'various'})
+
+    @patch('xopr.stac.catalog.extract_item_metadata')
+    def test_sequential_processing(self, mock_extract):
+        """Test that flights are processed in order without a client."""
+        mock_extract.return_value = create_mock_metadata()
+        flight_lines = self._flight_lines()
+
+        results = process_flights(flight_lines, create_mock_campaign_data(), self._conf())
+
+        assert [r['flight_id'] for r in results] == [fd['flight_id'] for fd in flight_lines]
+
+    @patch('xopr.stac.catalog.extract_item_metadata')
+    def test_distributed_processing_matches_sequential(self, mock_extract):
+        """Test that per-flight Dask tasks give the same campaign as sequential processing."""
+        mock_extract.return_value = create_mock_metadata()
+        flight_lines = self._flight_lines()
+        campaign = create_mock_campaign_data()
+        conf = self._conf()
+
+        with Client(processes=False, n_workers=2, threads_per_worker=1,
+                    dashboard_address=None) as client:
+            results = process_flights(flight_lines, campaign, conf, client)
+
+        assert [r['flight_id'] for r in results] == [fd['flight_id'] for fd in flight_lines]
+
+        collection = assemble_campaign_collection(results, campaign, conf)
+        assert collection.id == campaign['name']
+        assert [c.id for c in collection.get_children()] == [fd['flight_id'] for fd in flight_lines]
+
+    @patch('xopr.stac.catalog.extract_item_metadata')
+    def test_distributed_reprocessing_is_not_reused(self, mock_extract):
+        """Test that processing the same flights again in one client reruns the tasks."""
+        mock_extract.return_value = create_mock_metadata()
+        flight_lines = self._flight_lines()
+        campaign = create_mock_campaign_data()
+        conf = self._conf()
+
+        with Client(processes=False, n_workers=2, threads_per_worker=1,
+                    dashboard_address=None) as client:
+            process_flights(flight_lines, campaign, conf, client)
+            calls = mock_extract.call_count
+            results = process_flights(flight_lines, campaign, conf, client)
+
+        assert mock_extract.call_count == 2 * calls
+        assert [r['flight_id'] for r in results] == [fd['flight_id'] for fd in flight_lines]
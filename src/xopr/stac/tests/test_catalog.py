@@ -7,7 +7,8 @@ from datetime import datetime
 
 import pystac
 
-from xopr.stac.catalog import create_items_from_flight_data, build_collection_extent
+from xopr.stac.catalog import (create_items_from_flight_data, build_collection_extent,
+                               create_collection, export_collection_to_parquet)
 from .common import (create_mock_metadata, create_mock_flight_data, TEST_DOI, 
                      TEST_CITATION, SCI_EXT, SAR_EXT, get_test_config)
 
@@ -218,4 +219,30 @@ class TestBuildCollectionExtent:
         assert extent.spatial.bboxes[0] == bbox
         
         assert len(extent.temporal.intervals) == 1
-        assert extent.temporal.intervals[0] == [dt, dt]
\ No newline at end of file
+        assert extent.temporal.intervals[0] == [dt, dt]
+
+
+class TestExportCollectionToParquet:
+    """Test the export_collection_to_parquet function."""
+
+    @patch('xopr.stac.catalog.extract_item_metadata')
+    def test_export_with_provided_items(self, mock_extract, temp_output_dir):
+        """Test that a pre-built item list is exported without walking the collection."""
+        import pyarrow.parquet as pq
+
+        mock_extract.return_value = create_mock_metadata()
+        items = create_items_from_flight_data(create_mock_flight_data(), get_test_config())
+
+        collection = create_collection(
+            "2016_Antarctica_DC8", "Test collection", build_collection_extent(items)
+        )
+        collection.add_items(items)
+        config = get_test_config(output={'path': str(temp_output_dir)}, logging={'verbose': False})
+
+        with patch.object(pystac.Collection, 'get_items', side_effect=AssertionError):
+            parquet_path = export_collection_to_parquet(
+                collection, config, provider='cresis', items=items
+            )
+
+        assert parquet_path == temp_output_dir / "2016_Antarctica_DC8.parquet"
+        assert pq.read_metadata(parquet_path).num_rows == len(items)
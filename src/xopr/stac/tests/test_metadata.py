@@ -6,8 +6,9 @@ from unittest.mock import Mock, MagicMock, patch
 from pathlib import Path
 from shapely.geometry import LineString
 
-from xopr.stac.metadata import extract_stable_wfs_params, extract_item_metadata
-from .common import create_mock_dataset, TEST_DOI, TEST_ROR, TEST_FUNDER
+from xopr.stac.metadata import (extract_stable_wfs_params, extract_item_metadata,
+                                discover_flight_lines, _list_mat_files)
+from .common import create_mock_dataset, TEST_DOI, TEST_ROR, TEST_FUNDER, get_test_config
 
 
 class TestExtractItemMetadata:
@@ -523,3 +524,48 @@ class TestCollectMetadataFromItems:
         
         # May or may not have SCI extension depending on other fields,
         # but the key point is DOI is not aggregated
+
+
+class TestDiscoverFlightLines:
+    """Test the discover_flight_lines function."""
+
+    def test_discovers_flights_and_extra_products(self, tmp_path):
+        """Test flight discovery across primary and extra data products."""
+        campaign_path = tmp_path / "2016_Antarctica_DC8"
+        for flight_id in ['20161014_04', '20161014_03']:
+            flight_dir = campaign_path / "CSARP_standard" / flight_id
+            flight_dir.mkdir(parents=True)
+            (flight_dir / f"Data_{flight_id}_001.mat").touch()
+            (flight_dir / f"Data_img_01_{flight_id}_001.mat").touch()
+        layer_dir = campaign_path / "CSARP_layer" / "20161014_03"
+        layer_dir.mkdir(parents=True)
+        (layer_dir / "Data_20161014_03_001.mat").touch()
+        (campaign_path / "CSARP_standard" / "not_a_flight").mkdir()
+
+        conf = get_test_config(data={'extra_products': ['CSARP_layer', 'CSARP_qlook']})
+        flights = discover_flight_lines(campaign_path, conf)
+
+        assert [f['flight_id'] for f in flights] == ['20161014_03', '20161014_04']
+        first = flights[0]
+        assert first['date'] == '20161014'
+        assert first['flight_num'] == '03'
+        assert list(first['data_files']) == ['CSARP_standard', 'CSARP_layer']
+        assert first['data_files']['CSARP_standard'] == {
+            'Data_20161014_03_001.mat': str(campaign_path / "CSARP_standard" / "20161014_03" / "Data_20161014_03_001.mat")
+        }
+        assert list(flights[1]['data_files']) == ['CSARP_standard']
+
+    def test_mat_file_listing_matches_glob(self, tmp_path):
+        """Test that directory listings select the same entries as a *.mat glob."""
+        for name in ["Data_20161014_03_001.mat", ".Data_20161014_03_002.mat", "notes.txt"]:
+            (tmp_path / name).touch()
+        (tmp_path / "subdir.mat").mkdir()
+
+        expected = {f.name: str(f) for f in tmp_path.glob("*.mat")}
+        assert _list_mat_files(str(tmp_path)) == expected
+        assert _list_mat_files(str(tmp_path / "missing")) is None
+
+    def test_missing_primary_product_raises(self, tmp_path):
+        """Test that a missing primary product directory raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            discover_flight_lines(tmp_path, get_test_config())
@@ -48,4 +48,73 @@ def test_get_antarctic_regions_fields():
         assert field in regions.columns, f"Missing expected field: {field}"
     
     # Check that we have at least one region
-    assert len(regions) > 0, "Expected at least one region"
\ No newline at end of file
+    assert len(regions) > 0, "Expected at least one region"
+
+@pytest.fixture
+def local_boundaries(tmp_path):
+    """Write a small MEASURES-style boundaries file for offline tests."""
+    from shapely.geometry import box
+    import geopandas as gpd
+
+    gdf = gpd.GeoDataFrame({
+        'NAME': ['A', 'B'],
+        'Regions': ['East', 'West'],
+        'Subregions': ['A-Ap', 'F-G'],
+        'TYPE': ['GR', 'FL'],
+        'Asso_Shelf': ['', ''],
+    }, geometry=[box(10, -80, 20, -75), box(-100, -80, -90, -75)], crs="EPSG:4326")
+    path = tmp_path / "boundaries.geojson"
+    gdf.to_file(path, driver="GeoJSON")
+    return str(path)
+
+
+def test_get_antarctic_regions_loads_boundaries_once(local_boundaries, monkeypatch):
+    """
+    Test that the boundaries file is parsed once and the cached copy is not mutated.
+    """
+    import geopandas as gpd
+
+    calls = []
+    read_file = gpd.read_file
+    monkeypatch.setattr(gpd, 'read_file', lambda *a, **kw: calls.append(a) or read_file(*a, **kw))
+
+    first = xopr.geometry.get_antarctic_regions(
+        measures_boundaries_url=local_boundaries, merge_regions=False)
+    first.drop(first.index, inplace=True)
+    second = xopr.geometry.get_antarctic_regions(
+        regions='East', measures_boundaries_url=local_boundaries, merge_regions=False)
+
+    assert len(calls) == 1
+    assert list(second['NAME']) == ['A']
+
+
+def test_get_antarctic_regions_caches_merged_geometry(local_boundaries, tmp_path, monkeypatch):
+    """
+    Test that merged regions are written to cache_dir and reused for the same parameters.
+    """
+    cache_dir = str(tmp_path / "cache")
+    merged = xopr.geometry.get_antarctic_regions(
+        measures_boundaries_url=local_boundaries, cache_dir=cache_dir)
+
+    # A repeat call must not merge again
+    monkeypatch.setattr(xopr.geometry, '_load_measures_boundaries',
+                        lambda *a, **kw: pytest.fail("boundaries reloaded"))
+    cached = xopr.geometry.get_antarctic_regions(
+        measures_boundaries_url=local_boundaries, cache_dir=cache_dir)
+
+    assert cached.equals_exact(merged, tolerance=1e-9)
+    assert len(list((tmp_path / "cache" / "regions").glob("*.wkb"))) == 1
+
+
+def test_union_regions_handles_overlaps():
+    """
+    Test that region unions are correct for both coverages and overlapping polygons.
+    """
+    import numpy as np
+    from shapely.geometry import box
+
+    coverage = xopr.geometry._union_regions(np.array([box(0, 0, 1, 1), box(1, 0, 2, 1)]))
+    overlapping = xopr.geometry._union_regions(np.array([box(0, 0, 1, 1), box(0.5, 0, 2, 1)]))
+
+    assert coverage.geom_type == 'Polygon' and coverage.area == pytest.approx(2)
+    assert overlapping.geom_type == 'Polygon' and overlapping.area == pytest.approx(2)
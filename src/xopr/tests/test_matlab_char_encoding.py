@@ -12,7 +12,8 @@ import h5py
 import pytest
 from pathlib import Path
 
-from xopr.matlab_attribute_utils import decode_hdf5_matlab_variable
+from xopr.matlab_attribute_utils import (decode_hdf5_matlab_variable, clean_attrs,
+                                         strip_api_key, convert_object_ndarrays_to_lists)
 
 
 class TestMatlabCharDecoding:
@@ -180,6 +181,21 @@ class TestMatlabCharDecoding:
             os.unlink(tmp_file)
 
 
+class TestCleanAttrs:
+    """Test cleaning of legacy MATLAB attributes and the deprecated helpers."""
+
+    attrs = {'param': {'api_key': 'secret', 'names': np.array(['a', 'b'], dtype=object)}, 'n': 1}
+    expected = {'param': {'api_key': 'API_KEY_REMOVED', 'names': ['a', 'b']}, 'n': 1}
+
+    def test_clean_attrs(self):
+        assert clean_attrs(self.attrs) == self.expected
+
+    @pytest.mark.parametrize("helper", [strip_api_key, convert_object_ndarrays_to_lists])
+    def test_deprecated_helpers_delegate(self, helper):
+        with pytest.warns(DeprecationWarning):
+            assert helper(self.attrs) == self.expected
+
+
 class TestRealDataFiles:
     """Test with actual OPR data files to ensure backward compatibility."""
     
@@ -155,3 +155,163 @@ def test_exclude_geometry(query_params):
             if key in ['geometry', 'links']:
                 continue
             assert w_geom[key] == wo_geom[key], f"Expected {key} to match in both items, got {w_geom[key]} != {wo_geom[key]}"
+
+def test_load_frames_concurrent_order(monkeypatch):
+    """
+    Test that concurrently loaded frames keep the order of the STAC items and
+    that failing items are skipped when skip_errors is set.
+    """
+    import geopandas as gpd
+    import xarray as xr
+
+    def fake_load_frame(self, item, data_product="CSARP_standard", chunks=None, segment_metadata=None):
+        if item['id'] == 'bad':
+            raise ValueError("bad frame")
+        time.sleep(0.01 * (5 - len(item['id'])))
+        return xr.Dataset(attrs={'id': item['id']})
+
+    monkeypatch.setattr(xopr.OPRConnection, 'load_frame', fake_load_frame)
+    items = gpd.GeoDataFrame({'id': ['a', 'bb', 'bad', 'cccc']})
+
+    opr = xopr.OPRConnection()
+    frames = opr.load_frames(items, skip_errors=True, max_workers=4)
+    assert [f.attrs['id'] for f in frames] == ['a', 'bb', 'cccc']
+
+    with pytest.raises(ValueError):
+        opr.load_frames(items, max_workers=4)
+
+def test_load_frames_merge_flights(monkeypatch):
+    """
+    Test that merge_flights concatenates the frames of each segment.
+    """
+    import geopandas as gpd
+    import numpy as np
+    import xarray as xr
+
+    def fake_load_frame(self, item, data_product="CSARP_standard", chunks=None, segment_metadata=None):
+        frame = int(item['id'][-3:])
+        return xr.Dataset({'Data': ('slow_time', np.full(2, frame))},
+                          coords={'slow_time': [2 * frame, 2 * frame + 1]},
+                          attrs={'granule': item['id']})
+
+    monkeypatch.setattr(xopr.OPRConnection, 'load_frame', fake_load_frame)
+    items = gpd.GeoDataFrame({'id': ['20230109_01_002', '20230109_01_001']})
+
+    opr = xopr.OPRConnection()
+    flight = opr.load_frames(items, merge_flights=True)
+    assert isinstance(flight, xr.Dataset)
+    assert list(flight['Data'].values) == [1, 1, 2, 2]
+
+@pytest.mark.parametrize("status_code,expected", [(206, True), (200, False)])
+def test_supports_range_requests(monkeypatch, status_code, expected):
+    """
+    Test that range support is detected from the response to a range probe
+    and remembered per host.
+    """
+    import xopr.opr_access
+
+    class FakeResponse:
+        def __init__(self):
+            self.status_code = status_code
+        def raise_for_status(self):
+            pass
+        def __enter__(self):
+            return self
+        def __exit__(self, *args):
+            pass
+
+    probes = []
+    def fake_get(url, headers=None, **kwargs):
+        probes.append(headers['Range'])
+        return FakeResponse()
+
+    monkeypatch.setattr(xopr.opr_access.requests, 'get', fake_get)
+    monkeypatch.setattr(xopr.opr_access, '_range_request_support', {})
+
+    for _ in range(2):
+        assert xopr.opr_access._supports_range_requests('https://example.com/a/Data_001.mat') == expected
+    assert probes == ['bytes=0-0']
+    assert xopr.opr_access._supports_range_requests('gs://bucket/Data_001.mat')
+
+def test_load_frames_requests_segment_metadata_once(monkeypatch):
+    """
+    Test that load_frames requests the OPS metadata of each segment once and
+    passes it to every frame of that segment.
+    """
+    import geopandas as gpd
+    import xarray as xr
+
+    requests_made = []
+    def fake_get_segment_metadata(segment_name, season_name):
+        requests_made.append((segment_name, season_name))
+        return {'status': 1, 'data': {'dois': [segment_name]}}
+
+    received = {}
+    def fake_load_frame(self, item, data_product="CSARP_standard", chunks=None, segment_metadata=None):
+        received[item['id']] = segment_metadata
+        return xr.Dataset()
+
+    monkeypatch.setattr(xopr.ops_api, 'get_segment_metadata', fake_get_segment_metadata)
+    monkeypatch.setattr(xopr.OPRConnection, 'load_frame', fake_load_frame)
+    base = 'https://data.cresis.ku.edu/data/rds/2022_Antarctica_BaslerMKB/CSARP_standard'
+    frames = [('20230109_01', 1), ('20230109_01', 2), ('20230109_02', 1)]
+    items = gpd.GeoDataFrame({
+        'id': [f'{segment}_00{frame}' for segment, frame in frames],
+        'assets': [{'CSARP_standard': {'href': f'{base}/{segment}/Data_{segment}_00{frame}.mat'}}
+                   for segment, frame in frames],
+    })
+
+    xopr.OPRConnection().load_frames(items, max_workers=4)
+
+    assert sorted(requests_made) == [('20230109_01', '2022_Antarctica_BaslerMKB'),
+                                     ('20230109_02', '2022_Antarctica_BaslerMKB')]
+    assert {k: v['data']['dois'] for k, v in received.items()} == {
+        '20230109_01_001': ['20230109_01'], '20230109_01_002': ['20230109_01'],
+        '20230109_02_001': ['20230109_02']}
+
+def _write_frame(path, frame_id, n_slow=5, n_twtt=4):
+    """Write a small frame file laid out like a MATLAB v7.3 CSARP file."""
+    import h5py
+    import numpy as np
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with h5py.File(path, 'w', userblock_size=512) as f:
+        f['Data'] = np.random.default_rng(frame_id).random((n_slow, n_twtt))
+        f['Time'] = np.linspace(0, 1e-5, n_twtt)[None, :]
+        f['GPS_time'] = (1.67e9 + 10 * frame_id + np.arange(n_slow))[None, :]
+        f['Latitude'] = np.full((1, n_slow), -75.0)
+        f['Longitude'] = np.full((1, n_slow), -100.0)
+        f['Elevation'] = np.full((1, n_slow), 500.0)
+    return path
+
+def test_loaded_frames_release_files(tmp_path, monkeypatch):
+    """
+    Test that a lazily loaded frame's file is closed with the Dataset, and that
+    merged flights don't keep the frame files open.
+    """
+    import geopandas as gpd
+
+    opened = []
+    def tracking_open(self, url):
+        file = open(url, 'rb')
+        opened.append(file)
+        return file
+
+    monkeypatch.setattr(xopr.OPRConnection, '_open_frame_file', tracking_open)
+    monkeypatch.setattr(xopr.ops_api, 'get_segment_metadata', lambda segment_name, season_name: None)
+
+    segment_dir = tmp_path / '2022_Antarctica_BaslerMKB' / 'CSARP_standard' / '20230109_01'
+    paths = [_write_frame(segment_dir / f'Data_20230109_01_00{i}.mat', i) for i in (1, 2)]
+    opr = xopr.OPRConnection()
+
+    ds = opr.load_frame_url(str(paths[0]))
+    assert not opened[-1].closed
+    ds.close()
+    assert opened[-1].closed
+
+    opened.clear()
+    items = gpd.GeoDataFrame({'id': ['a', 'b'],
+                              'assets': [{'CSARP_standard': {'href': str(p)}} for p in paths]})
+    flight = opr.load_frames(items, merge_flights=True)
+    assert flight.sizes['slow_time'] == 10
+    assert len(opened) == 2 and all(f.closed for f in opened)
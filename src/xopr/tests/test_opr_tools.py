@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+import xopr
+
+
+def _times(seconds):
+    return pd.to_datetime(np.asarray(seconds) + 1.5e9, unit='s').values
+
+
+def test_merge_layers_ops_style():
+    """
+    Test merging layers shaped like OPRConnection.get_layers_db output, which
+    carry a per-point 'lyr_id' variable.
+    """
+    layers = {
+        1: xr.Dataset({'twtt': ('slow_time', [1.0, 2.0, 3.0]), 'lyr_id': ('slow_time', [1.0, 1.0, 1.0])},
+                      coords={'slow_time': _times([0, 1, 2])}),
+        2: xr.Dataset({'twtt': ('slow_time', [5.0, 6.0]), 'lyr_id': ('slow_time', [2.0, 2.0])},
+                      coords={'slow_time': _times([1, 3])}),
+    }
+
+    merged = xopr.merge_layers(layers)
+
+    assert list(merged['lyr_id'].values) == [1, 2]
+    assert merged.sizes['slow_time'] == 4
+    np.testing.assert_array_equal(merged['twtt'].sel(lyr_id=1).values, [1.0, 2.0, 3.0, np.nan])
+    np.testing.assert_array_equal(merged['twtt'].sel(lyr_id=2).values, [np.nan, 5.0, np.nan, 6.0])
+
+
+def test_merge_layers_file_style():
+    """
+    Test merging layers shaped like OPRConnection.get_layers_files output.
+    """
+    time = _times([0, 1, 2])
+    layers = {
+        layer_id: xr.Dataset({'twtt': ('slow_time', np.full(3, float(layer_id))),
+                              'quality': ('slow_time', np.ones(3)),
+                              'lat': ('slow_time', [-75.0, -75.1, -75.2])},
+                             coords={'slow_time': time}, attrs={'source_url': 'layer.mat'})
+        for layer_id in (1, 2)
+    }
+
+    merged = xopr.merge_layers(layers)
+
+    assert dict(merged.sizes) == {'lyr_id': 2, 'slow_time': 3}
+    np.testing.assert_array_equal(merged['twtt'].values, [[1.0] * 3, [2.0] * 3])
+    assert merged.attrs['source_url'] == 'layer.mat'
+
+
+def test_merge_layers_duplicate_and_unsorted_times():
+    """
+    Test that duplicate slow_time values within a layer keep the first pick
+    and that unsorted layers are aligned on sorted times.
+    """
+    layers = {
+        1: xr.Dataset({'twtt': ('slow_time', [3.0, 1.0, 1.5, 2.0])},
+                      coords={'slow_time': _times([2, 0, 0, 1])}),
+        2: xr.Dataset({'twtt': ('slow_time', [7.0, 8.0])},
+                      coords={'slow_time': _times([3, 3])}),
+    }
+
+    merged = xopr.merge_layers(layers)
+
+    np.testing.assert_array_equal(merged['slow_time'].values, _times([0, 1, 2, 3]))
+    np.testing.assert_array_equal(merged['twtt'].sel(lyr_id=1).values, [1.0, 2.0, 3.0, np.nan])
+    np.testing.assert_array_equal(merged['twtt'].sel(lyr_id=2).values, [np.nan, np.nan, np.nan, 7.0])
+
+
+def test_merge_layers_empty():
+    assert len(xopr.merge_layers({}).data_vars) == 0
+
+
+def test_generate_citation_falls_back_to_ror_ids(monkeypatch):
+    """
+    Test that institutions whose ROR lookup fails are cited by their ROR ID,
+    including when every lookup fails.
+    """
+    names = {'02jx3x895': 'University College London'}
+    monkeypatch.setattr(xopr.opr_tools, 'get_ror_display_name', lambda ror, cache_dir=None: names.get(ror))
+
+    citation = xopr.opr_tools.generate_citation(xr.Dataset(attrs={'ror': ['02jx3x895', '001tmjg57']}))
+    assert "collected by University College London, 001tmjg57." in citation
+
+    citation = xopr.opr_tools.generate_citation(xr.Dataset(attrs={'ror': ['001tmjg57', '04fa4r544']}))
+    assert "collected by 001tmjg57, 04fa4r544." in citation
+
+    citation = xopr.opr_tools.generate_citation(xr.Dataset(attrs={'ror': '001tmjg57'}))
+    assert "collected by 001tmjg57." in citation
@@ -66,3 +66,29 @@ def test_get_segment_metadata_invalid_flights(season, flight_id):
     result = xopr.ops_api.get_segment_metadata(flight_id, season)
 
     assert result.get('status') == 0, f"Expected status 0 for invalid flight {season}/{flight_id}, got {result.get('status')}"
+
+
+def test_get_segment_metadata_caches_only_successes(monkeypatch):
+    """
+    Test that successful segment metadata responses are cached and returned as
+    copies, while failed responses are requested again on the next call.
+    """
+    responses = [{'status': 0, 'data': 'error'}, {'status': 1, 'data': {'dois': ['a']}}]
+    calls = []
+
+    def fake_request(path, data, **kwargs):
+        calls.append(path)
+        return responses[min(len(calls), len(responses)) - 1]
+
+    monkeypatch.setattr(xopr.ops_api, '_ops_api_request', fake_request)
+    xopr.ops_api._fetch_segment_metadata.cache_clear()
+    try:
+        assert xopr.ops_api.get_segment_metadata('20230109_01', 'cache_test')['status'] == 0
+        first = xopr.ops_api.get_segment_metadata('20230109_01', 'cache_test')
+        assert first['status'] == 1
+        first['data']['dois'].append('b')
+
+        assert xopr.ops_api.get_segment_metadata('20230109_01', 'cache_test')['data']['dois'] == ['a']
+        assert len(calls) == 2
+    finally:
+        xopr.ops_api._fetch_segment_metadata.cache_clear()
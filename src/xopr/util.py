@@ -1,13 +1,30 @@
 import xarray as xr
 import numpy as np
 import pandas as pd
+import collections
+import functools
 import itertools
 import requests
 import json
+import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List, Sequence, TypeVar, Optional
 
 T = TypeVar("T")
 
+ror_api_url = "https://api.ror.org/organizations"
+ror_api_timeout = 10  # seconds
+
+# Shared session so repeated ROR lookups reuse HTTPS connections, retrying
+# transient failures (rate limiting, server errors) with backoff
+_ror_session = requests.Session()
+_ror_session.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
 def dict_equiv(first: dict, second: dict) -> bool:
     """Compare two dictionaries for equivalence (identity or equality).
 
@@ -77,9 +94,6 @@ def equivalent(first, second) -> bool:
     bool
         True if objects are identical, equal, or both are null/NaN, False otherwise.
     """
-    
-    from xarray.core import duck_array_ops
-
     if first is second:
         return True
     if isinstance(first, np.ndarray) or isinstance(second, np.ndarray):
@@ -120,11 +134,12 @@ def merge_dicts_no_conflicts(dicts: List[Dict[str, Any]], context=None) -> Dict[
     {'a': 1}  # 'b' dropped due to conflict
     """
     merged = {}
-    # Create set of all keys across dictionaries
-    all_keys = set().union(*(d.keys() for d in dicts))
-    for key in all_keys:
-        # Collect values for the current key from all dictionaries
-        values = [d.get(key) for d in dicts if key in d]
+    # Collect the values for every key in a single pass over the dictionaries
+    values_by_key = collections.defaultdict(list)
+    for d in dicts:
+        for key, value in d.items():
+            values_by_key[key].append(value)
+    for key, values in values_by_key.items():
         if len(values) == 1:
             merged[key] = values[0]  # Only one value, no conflict
         else:
@@ -147,12 +162,79 @@ def merge_dicts_no_conflicts(dicts: List[Dict[str, Any]], context=None) -> Dict[
                     merged[key] = values[0]
     return merged
 
-def get_ror_display_name(ror_id: str) -> Optional[str]:
+def seconds_to_datetime64(seconds) -> np.ndarray:
+    """Convert seconds since the Unix epoch to a datetime64[ns] array.
+
+    Equivalent to ``pd.to_datetime(seconds, unit='s').values`` (including its
+    rounding of fractional seconds and NaN -> NaT), but done as a few
+    vectorized NumPy operations without the pandas conversion overhead.
+
+    Parameters
+    ----------
+    seconds : array-like
+        Times in seconds since 1970-01-01 (e.g. the OPR GPS_time variable).
+
+    Returns
+    -------
+    np.ndarray
+        Array of dtype datetime64[ns] with the same shape as ``seconds``.
+    """
+    seconds = np.asarray(seconds, dtype=np.float64)
+    nat = np.isnan(seconds)
+    if nat.any():
+        seconds = np.where(nat, 0.0, seconds)
+    # Split into whole and fractional seconds so the fraction is scaled
+    # without losing precision to the large epoch offset
+    whole = np.trunc(seconds)
+    frac = np.round(seconds - whole, 9)
+    ns = whole.astype(np.int64) * 1_000_000_000 + (frac * 1e9).astype(np.int64)
+    if nat.any():
+        ns[nat] = np.iinfo(np.int64).min
+    return ns.view('datetime64[ns]')
+
+@functools.lru_cache(maxsize=1024)
+def _fetch_ror_record(ror_id: str, cache_dir: Optional[str] = None) -> dict:
+    """
+    Fetch and parse the ROR API record for a ROR identifier.
+
+    Successful lookups are memoized; failures raise and are not cached, so
+    they are retried on the next call. If cache_dir is given, records are
+    also stored there as JSON and reused by later sessions.
+    """
+    cache_path = None
+    if cache_dir and ror_id.isalnum():  # ROR IDs are short alphanumeric strings
+        cache_path = os.path.join(cache_dir, "ror", f"{ror_id}.json")
+        try:
+            with open(cache_path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    response = _ror_session.get(f"{ror_api_url}/{ror_id}", timeout=ror_api_timeout)
+    response.raise_for_status()
+    data = response.json()
+
+    if cache_path:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # The on-disk cache is best effort
+    return data
+
+def get_ror_display_name(ror_id: str, cache_dir: Optional[str] = None) -> Optional[str]:
     """
     Parse ROR API response to find the for_display name of a given ROR ID.
     
+    Lookups are cached per ROR ID for the lifetime of the process, and
+    across sessions if cache_dir is given.
+    
     Args:
         ror_id (str): The ROR identifier (e.g., "https://ror.org/02jx3x895" or just "02jx3x895")
+        cache_dir (str, optional): Directory in which to keep ROR records on disk
     
     Returns:
         Optional[str]: The for_display name if found, None otherwise
@@ -162,13 +244,8 @@ def get_ror_display_name(ror_id: str) -> Optional[str]:
         ror_id = ror_id.replace('https://ror.org/', '')
     
     try:
-        # Make request to ROR API
-        url = f"https://api.ror.org/organizations/{ror_id}"
-        response = requests.get(url)
-        response.raise_for_status()
-        
-        # Parse JSON response
-        data = response.json()
+        # Make request to ROR API (cached)
+        data = _fetch_ror_record(ror_id, cache_dir)
         
         # Extract for_display name
         names = data.get('names', [])
@@ -184,4 +261,4 @@ def get_ror_display_name(ror_id: str) -> Optional[str]:
         return None
     except (json.JSONDecodeError, KeyError) as e:
         print(f"Error parsing ROR API response: {e}")
-        return None
\ No newline at end of file
+        return None